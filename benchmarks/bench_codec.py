@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark per-event JSON encode/decode cost for each codec backend.
+
+Encodes and decodes a representative chat event envelope and a command
+envelope with every installed backend (json, orjson, msgspec), reporting
+microseconds per operation. Backends that are not installed are skipped.
+
+Usage:
+    python benchmarks/bench_codec.py [--iterations N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for development testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kryten.codec import get_codec  # noqa: E402
+
+EVENT = {
+    "event_name": "chatMsg",
+    "payload": {
+        "user": {"name": "alice", "rank": 1},
+        "msg": "hello from the benchmark, with a moderately long message body",
+        "time": 1_700_000_000_000,
+        "meta": {"shadow": False, "addClass": None},
+    },
+    "channel": "lounge",
+    "domain": "cytu.be",
+    "timestamp": "2024-01-01T00:00:00+00:00",
+    "correlation_id": "5f0c6e4e-6c1b-4b39-9d55-1f3cfd6a6d3f",
+}
+
+COMMAND = {
+    "command": "chat",
+    "args": {"message": "hello"},
+    "meta": {
+        "source": "mybot",
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "domain": "cytu.be",
+        "channel": "lounge",
+        "request_id": "5f0c6e4e-6c1b-4b39-9d55-1f3cfd6a6d3f",
+    },
+}
+
+
+def time_per_op(func, arg, iterations: int) -> float:
+    """Return microseconds per call of ``func(arg)``."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(arg)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100000, help="Operations per measurement")
+    args = parser.parse_args()
+
+    encoded_event = get_codec("json").dumps(EVENT)
+    print(f"{'codec':<10} {'decode event':>14} {'encode command':>16}")
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name:<10} {'not installed':>14}")
+            continue
+        decode = time_per_op(codec.loads, encoded_event, args.iterations)
+        encode = time_per_op(codec.dumps, COMMAND, args.iterations)
+        print(f"{name:<10} {decode:>11.2f} us {encode:>13.2f} us")
+
+
+if __name__ == "__main__":
+    main()
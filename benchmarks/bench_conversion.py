@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Benchmark typed event conversion cost per message.
+
+Registers five ``chatmsg`` handlers and pushes chat events through
+``_on_message``, reporting events/sec, typed conversions per message and
+memory allocated per message (via tracemalloc).
+
+Usage:
+    python benchmarks/bench_conversion.py [--events N] [--handlers N]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add src to path for development testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kryten import KrytenClient  # noqa: E402
+
+
+class FakeMsg:
+    """Minimal stand-in for a nats-py Msg."""
+
+    def __init__(self, subject: str, data: bytes) -> None:
+        self.subject = subject
+        self.data = data
+        self.reply = ""
+
+
+def build_client(handler_count: int) -> tuple[KrytenClient, list[int]]:
+    """Create a client with ``handler_count`` chat handlers and a conversion counter."""
+    client = KrytenClient(
+        {
+            "nats": {"servers": ["nats://localhost:4222"]},
+            "channels": [{"domain": "cytu.be", "channel": "lounge"}],
+        }
+    )
+
+    async def handler(event):
+        return event.message
+
+    for _ in range(handler_count):
+        client.on("chatmsg")(handler)
+
+    conversions = [0]
+    convert = client._convert_to_typed_event
+
+    def counting_convert(raw_event):
+        conversions[0] += 1
+        return convert(raw_event)
+
+    client._convert_to_typed_event = counting_convert  # type: ignore[method-assign]
+    return client, conversions
+
+
+def build_messages(count: int) -> list[FakeMsg]:
+    """Build chat messages with nested user info and a millisecond timestamp."""
+    messages = []
+    for i in range(count):
+        payload = {
+            "event_name": "chatMsg",
+            "payload": {
+                "user": {"name": f"user{i % 97}", "rank": 1},
+                "msg": f"message number {i}",
+                "time": 1_700_000_000_000 + i,
+                "meta": {},
+            },
+            "channel": "lounge",
+            "domain": "cytu.be",
+        }
+        messages.append(
+            FakeMsg("kryten.events.cytube.lounge.chatmsg", json.dumps(payload).encode("utf-8"))
+        )
+    return messages
+
+
+async def run(count: int, handler_count: int) -> None:
+    """Run the benchmark and print results."""
+    client, conversions = build_client(handler_count)
+    messages = build_messages(count)
+
+    for msg in messages[:500]:
+        await client._on_message(msg)
+    conversions[0] = 0
+
+    start = time.perf_counter()
+    for msg in messages:
+        await client._on_message(msg)
+    elapsed = time.perf_counter() - start
+    per_message = conversions[0] / count
+
+    # Peak memory held while a single message is being dispatched
+    sample = messages[:2000]
+    total_peak = 0
+    tracemalloc.start()
+    for msg in sample:
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        await client._on_message(msg)
+        total_peak += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+
+    print(f"conversion: {count / elapsed:,.0f} events/sec ({handler_count} handlers)")
+    print(f"conversion: {per_message:.2f} typed conversions per message")
+    print(f"conversion: {total_peak / len(sample):,.0f} bytes peak memory per message")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=10000, help="Events to dispatch")
+    parser.add_argument("--handlers", type=int, default=5, help="chatmsg handlers")
+    args = parser.parse_args()
+    asyncio.run(run(args.events, args.handlers))
+
+
+if __name__ == "__main__":
+    main()
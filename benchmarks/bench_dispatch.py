@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark KrytenClient._on_message handler dispatch.
+
+Registers ~60 handlers across 40 channels (a mix of global and
+channel-filtered handlers) and pushes synthetic CyTube events through
+``_on_message`` without a NATS server, reporting events/sec.
+
+Usage:
+    python benchmarks/bench_dispatch.py [--events N]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for development testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kryten import KrytenClient  # noqa: E402
+
+CHANNEL_COUNT = 40
+EVENT_NAMES = ["chatmsg", "adduser", "userleave", "changemedia", "mediaupdate", "usercount"]
+
+
+class FakeMsg:
+    """Minimal stand-in for a nats-py Msg."""
+
+    def __init__(self, subject: str, data: bytes) -> None:
+        self.subject = subject
+        self.data = data
+        self.reply = ""
+
+
+def build_client() -> KrytenClient:
+    """Create a client with 40 channels and ~60 handlers."""
+    channels = [{"domain": "cytu.be", "channel": f"chan{i}"} for i in range(CHANNEL_COUNT)]
+    client = KrytenClient({"nats": {"servers": ["nats://localhost:4222"]}, "channels": channels})
+
+    async def handler(event):
+        return None
+
+    # 20 global handlers spread across the event names
+    for i in range(20):
+        client.on(EVENT_NAMES[i % len(EVENT_NAMES)])(handler)
+    # 40 channel-specific chat handlers
+    for i in range(CHANNEL_COUNT):
+        client.on("chatmsg", channel=f"chan{i}")(handler)
+    return client
+
+
+def build_messages(count: int) -> list[FakeMsg]:
+    """Build a round-robin stream of events across channels and event names."""
+    messages = []
+    for i in range(count):
+        channel = f"chan{i % CHANNEL_COUNT}"
+        event_name = EVENT_NAMES[i % len(EVENT_NAMES)]
+        payload = {
+            "event_name": event_name,
+            "payload": {"username": f"user{i % 97}", "msg": "hello there", "time": 0},
+            "channel": channel,
+            "domain": "cytu.be",
+        }
+        subject = f"kryten.events.cytube.{channel}.{event_name}"
+        messages.append(FakeMsg(subject, json.dumps(payload).encode("utf-8")))
+    return messages
+
+
+async def run(count: int) -> float:
+    """Dispatch ``count`` events and return events/sec."""
+    client = build_client()
+    messages = build_messages(count)
+
+    # Warm up
+    for msg in messages[:500]:
+        await client._on_message(msg)
+
+    start = time.perf_counter()
+    for msg in messages:
+        await client._on_message(msg)
+    elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20000, help="Events to dispatch")
+    args = parser.parse_args()
+
+    rate = asyncio.run(run(args.events))
+    print(f"dispatch: {rate:,.0f} events/sec ({args.events} events)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Compare pydantic and fast (``__slots__``) inbound event models.
+
+Pushes chat events through ``_on_message`` with ``fast_models`` off and on,
+reporting events/sec, the CPU share needed to sustain a target rate
+(default 10k events/sec) and memory retained per typed event.
+
+Usage:
+    python benchmarks/bench_models.py [--events N] [--rate N]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add src to path for development testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kryten import KrytenClient  # noqa: E402
+
+
+class FakeMsg:
+    """Minimal stand-in for a nats-py Msg."""
+
+    def __init__(self, subject: str, data: bytes) -> None:
+        self.subject = subject
+        self.data = data
+        self.reply = ""
+
+
+def build_messages(count: int) -> list[FakeMsg]:
+    """Build chat messages shaped like the bridge's envelopes."""
+    messages = []
+    for i in range(count):
+        envelope = {
+            "event_name": "chatMsg",
+            "payload": {
+                "user": {"name": f"user{i % 97}", "rank": 1},
+                "msg": f"message number {i}",
+                "time": 1_700_000_000_000 + i,
+                "meta": {},
+            },
+            "channel": "lounge",
+            "domain": "cytu.be",
+            "timestamp": "2024-01-01T00:00:00.000000+00:00",
+            "correlation_id": f"00000000-0000-4000-8000-{i:012d}",
+        }
+        messages.append(
+            FakeMsg("kryten.events.cytube.lounge.chatmsg", json.dumps(envelope).encode())
+        )
+    return messages
+
+
+async def run_mode(fast_models: bool, messages: list[FakeMsg], rate: int) -> None:
+    """Benchmark one model backend."""
+    client = KrytenClient(
+        {
+            "nats": {"servers": ["nats://localhost:4222"]},
+            "channels": [{"domain": "cytu.be", "channel": "lounge"}],
+            "fast_models": fast_models,
+        }
+    )
+    kept: list = []
+
+    @client.on("chatmsg")
+    async def handler(event):
+        kept.append(event)
+
+    for msg in messages[:500]:
+        await client._on_message(msg)
+    kept.clear()
+
+    start = time.perf_counter()
+    for msg in messages:
+        await client._on_message(msg)
+    elapsed = time.perf_counter() - start
+    per_sec = len(messages) / elapsed
+
+    # Memory retained by the typed events a handler keeps
+    kept.clear()
+    sample = messages[:5000]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for msg in sample:
+        await client._on_message(msg)
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    label = "fast" if fast_models else "pydantic"
+    print(
+        f"models[{label:>8}]: {per_sec:>8,.0f} events/sec, "
+        f"{rate / per_sec:>5.1%} of one core at {rate:,}/s, "
+        f"{retained / len(sample):>6,.0f} bytes retained per event"
+    )
+    await client._dispatcher.stop()
+
+
+async def run(count: int, rate: int) -> None:
+    messages = build_messages(count)
+    await run_mode(False, messages, rate)
+    await run_mode(True, messages, rate)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20000, help="Events to dispatch")
+    parser.add_argument("--rate", type=int, default=10000, help="Target events/sec")
+    args = parser.parse_args()
+    asyncio.run(run(args.events, args.rate))
+
+
+if __name__ == "__main__":
+    main()
@@ -29,7 +29,15 @@ except PackageNotFoundError:
     __version__ = "0.0.0"
 
 from kryten.client import KrytenClient
-from kryten.config import ChannelConfig, KrytenConfig, MetricsConfig, NatsConfig, ServiceConfig
+from kryten.codec import JsonCodec, get_codec
+from kryten.config import (
+    ChannelConfig,
+    JetStreamConfig,
+    KrytenConfig,
+    MetricsConfig,
+    NatsConfig,
+    ServiceConfig,
+)
 from kryten.exceptions import (
     HandlerError,
     KrytenConnectionError,
@@ -70,6 +78,10 @@ __all__ = [
     "ChannelConfig",
     "ServiceConfig",
     "MetricsConfig",
+    "JetStreamConfig",
+    # JSON codecs
+    "JsonCodec",
+    "get_codec",
     # Event models
     "RawEvent",
     "ChatMessageEvent",
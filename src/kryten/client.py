@@ -1,26 +1,37 @@
 """Core Kryten client implementation."""
 
 import asyncio
-import json
+import functools
 import logging
 import random
 import time
 import uuid
 from collections import defaultdict
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Hashable
 from datetime import datetime, timezone
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
 import nats
 from nats.aio.client import Client as NATSClient
+from nats.js.api import AckPolicy, ConsumerConfig
 
 from kryten import __version__
-from kryten.config import KrytenConfig
+from kryten.codec import get_codec
+from kryten.config import JetStreamConfig, KrytenConfig
+from kryten.dispatcher import HandlerDispatcher
 from kryten.exceptions import (
     KrytenConnectionError,
     KrytenValidationError,
     PublishError,
 )
+from kryten.fast_models import (
+    FastChangeMediaEvent,
+    FastChatMessageEvent,
+    FastPlaylistUpdateEvent,
+    FastRawEvent,
+    FastUserJoinEvent,
+    FastUserLeaveEvent,
+)
 from kryten.health import ChannelInfo, HealthStatus
 from kryten.kv_store import (
     get_kv_store,
@@ -40,7 +51,79 @@ from kryten.models import (
     UserJoinEvent,
     UserLeaveEvent,
 )
-from kryten.subject_builder import SUBJECT_PREFIX, build_command_subject
+from kryten.subject_builder import SUBJECT_PREFIX, build_command_subject, normalize_token
+
+
+class _HandlerEntry(NamedTuple):
+    """Registered event handler with its optional channel/domain filters."""
+
+    handler: Callable[[Any], Any]
+    channel: str | None
+    domain: str | None
+    broadcast: bool = False
+
+
+class _EventModels(NamedTuple):
+    """Classes used to build inbound events (validated or fast)."""
+
+    raw: Callable[..., Any]
+    chat: Callable[..., Any]
+    user_join: Callable[..., Any]
+    user_leave: Callable[..., Any]
+    change_media: Callable[..., Any]
+    playlist_update: Callable[..., Any]
+
+
+_VALIDATED_MODELS = _EventModels(
+    RawEvent,
+    ChatMessageEvent,
+    UserJoinEvent,
+    UserLeaveEvent,
+    ChangeMediaEvent,
+    PlaylistUpdateEvent,
+)
+
+_FAST_MODELS = _EventModels(
+    FastRawEvent.parse,
+    FastChatMessageEvent,
+    FastUserJoinEvent,
+    FastUserLeaveEvent,
+    FastChangeMediaEvent,
+    FastPlaylistUpdateEvent,
+)
+
+
+_CATCH_ALL = "*"
+"""Event name that registers a handler for every event."""
+
+_EVENT_SUBJECT_PREFIX = f"{SUBJECT_PREFIX}.cytube."
+"""Prefix of bridge event subjects: kryten.events.cytube.{channel}.{event}."""
+
+
+_UNCONVERTED = object()
+"""Sentinel marking a _LazyTypedEvent whose conversion has not run yet."""
+
+
+class _LazyTypedEvent:
+    """Converts a RawEvent to its typed model on first use.
+
+    One instance is shared by all handlers of a message, so the typed event is
+    built at most once per message and every handler receives the same object.
+    """
+
+    __slots__ = ("raw_event", "_converter", "_typed")
+
+    def __init__(self, raw_event: RawEvent | FastRawEvent, converter: Callable[[Any], Any]) -> None:
+        self.raw_event = raw_event
+        self._converter = converter
+        self._typed: Any = _UNCONVERTED
+
+    def get(self) -> Any:
+        """Return the typed event, converting on the first call."""
+        typed = self._typed
+        if typed is _UNCONVERTED:
+            typed = self._typed = self._converter(self.raw_event)
+        return typed
 
 
 class KrytenClient:
@@ -96,12 +179,41 @@ class KrytenClient:
         self._connection_time: float | None = None
 
         # Event handlers: {event_name: [(handler, channel_filter, domain_filter), ...]}
-        self._handlers: dict[
-            str, list[tuple[Callable[[Any], Any], str | None, str | None]]
-        ] = defaultdict(list)
+        self._handlers: dict[str, list[_HandlerEntry]] = defaultdict(list)
+        # Subject tokens (normalized event names) that have at least one handler
+        self._handled_event_tokens: set[str] = set()
+
+        # Precompiled dispatch index: {(event_name, channel, domain): (handler, ...)}
+        # Holds configured channels only; updated per event name by on()
+        # Keyed by (event, channel, domain), plus a broadcast flag when load balancing
+        self._dispatch_index: dict[tuple[Any, ...], tuple[Callable[[Any], Any], ...]] = {}
+        # Queue group shared by service replicas (empty when load balancing is off)
+        service = self.config.service
+        self._queue_group = service.name if service and service.load_balance else ""
+
+        # JSON codec for every payload published or received
+        self._codec = get_codec(self.config.json_codec)
+
+        # Inbound event classes: pydantic models, or unvalidated slots classes
+        self._event_models = _FAST_MODELS if self.config.fast_models else _VALIDATED_MODELS
+
+        # Bounded worker pool that runs handler invocations
+        self._dispatcher = HandlerDispatcher(
+            self._invoke_handler,
+            max_workers=self.config.max_concurrent_handlers,
+            max_queue=self.config.handler_queue_size,
+            overflow=self.config.handler_overflow_policy,
+            logger=self.logger,
+        )
 
         # Subscriptions
         self._subscriptions: list[Any] = []
+        # Event subscriptions managed by _sync_subscriptions, keyed by (subject, broadcast)
+        self._event_subscriptions: dict[tuple[str, bool | None], Any] = {}
+        self._subscription_lock = asyncio.Lock()
+        self._subscription_tasks: set[asyncio.Task] = set()
+        # JetStream pull-consumer fetch loops (when config.jetstream is set)
+        self._intake_tasks: list[asyncio.Task] = []
 
         # Control flow
         self._running = False
@@ -109,6 +221,7 @@ class KrytenClient:
 
         # Metrics
         self._events_received = 0
+        self._events_skipped = 0
         self._commands_sent = 0
         self._errors = 0
         self._event_latencies: list[float] = []
@@ -185,6 +298,7 @@ class KrytenClient:
                     enable_heartbeat=self.config.service.enable_heartbeat,
                     enable_discovery=self.config.service.enable_discovery,
                     logger=self.logger,
+                    codec=self._codec,
                     health_port=health_port,
                     health_path=health_path,
                     metrics_port=metrics_port,
@@ -228,8 +342,12 @@ class KrytenClient:
                         pass
                 self._lifecycle = None
 
+            # Stop JetStream fetch loops before the connection goes away
+            await self._stop_jetstream_intake()
+
             # Clear subscription references - drain() will handle actual unsubscribe
             self._subscriptions.clear()
+            self._event_subscriptions.clear()
 
             # Use close() instead of drain() to avoid timeout issues
             # drain() can hang if the server is slow or messages are in-flight
@@ -245,6 +363,9 @@ class KrytenClient:
             self._nats = None
             self._connection_time = None
 
+            # No more events can arrive; stop the handler worker pool
+            await self._dispatcher.stop()
+
             self.logger.info("Disconnected from NATS successfully")
 
         except Exception as e:
@@ -347,13 +468,18 @@ class KrytenClient:
         event_name: str,
         channel: str | None = None,
         domain: str | None = None,
+        broadcast: bool = False,
     ) -> Callable[[Callable[[Any], Any]], Callable[[Any], Any]]:
         """Decorator to register event handler.
 
         Args:
-            event_name: CyTube event type (e.g., "chatmsg", "adduser")
+            event_name: CyTube event type (e.g., "chatmsg", "adduser"), or "*" to
+                        receive every event
             channel: Optional specific channel filter (None = all channels)
             domain: Optional specific domain filter (None = all domains)
+            broadcast: With ``ServiceConfig.load_balance`` enabled, deliver every
+                       event to this handler on every replica instead of sharing
+                       events across the service's queue group
 
         Returns:
             Decorator function
@@ -370,13 +496,39 @@ class KrytenClient:
             >>> @client.on("chatmsg", channel="lounge")
             ... async def on_lounge_chat(event: ChatMessageEvent):
             ...     print(f"Lounge: {event.message}")
+
+            Track every user join on every replica of a load-balanced service:
+
+            >>> @client.on("adduser", broadcast=True)
+            ... async def on_join(event: UserJoinEvent):
+            ...     seen_users.add(event.username)
+
+            Handle every event:
+
+            >>> @client.on("*")
+            ... async def on_any(event):
+            ...     print(type(event).__name__)
         """
 
         def decorator(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
-            self._handlers[event_name.lower()].append((func, channel, domain))
+            key = event_name.lower()
+            self._handlers[key].append(_HandlerEntry(func, channel, domain, broadcast))
+            self._handled_event_tokens.add(normalize_token(key))
+            if key == _CATCH_ALL:
+                # Catch-all handlers join every event's handler list
+                for indexed in list(self._handlers):
+                    self._index_event_handlers(indexed)
+            else:
+                self._index_event_handlers(key)
+            if (
+                self._connected
+                and self.config.subscribe_per_event
+                and self.config.jetstream is None
+            ):
+                self._schedule_subscription_sync()
             self.logger.debug(
                 f"Registered handler for event '{event_name}'",
-                extra={"channel": channel, "domain": domain},
+                extra={"channel": channel, "domain": domain, "broadcast": broadcast},
             )
             return func
 
@@ -435,6 +587,7 @@ class KrytenClient:
         self,
         subject: str,
         handler: Callable[[Any], Any],
+        queue: str = "",
     ) -> Any:
         """Subscribe to an arbitrary NATS subject.
 
@@ -446,6 +599,8 @@ class KrytenClient:
             handler: Async callback function to handle messages.
                     Signature: async def handler(msg) -> None
                     The msg object has .data (bytes), .subject (str), etc.
+            queue: Optional NATS queue group; each message is delivered to only
+                   one subscriber in the group
 
         Returns:
             Subscription object (can be used to unsubscribe later)
@@ -475,10 +630,10 @@ class KrytenClient:
 
         self.logger.debug(f"Subscribing to custom subject: {subject}")
 
-        sub = await self._nats.subscribe(subject, cb=handler)
+        sub = await self._nats.subscribe(subject, queue=queue, cb=handler)
         self._subscriptions.append(sub)
 
-        self.logger.info(f"Subscribed to: {subject}")
+        self.logger.info(f"Subscribed to: {subject}" + (f" (queue {queue})" if queue else ""))
         return sub
 
     async def unsubscribe(self, subscription: Any) -> None:
@@ -530,7 +685,7 @@ class KrytenClient:
 
         # Convert data to bytes
         if isinstance(data, dict):
-            payload = json.dumps(data).encode("utf-8")
+            payload = self._codec.dumps(data)
         elif isinstance(data, str):
             payload = data.encode("utf-8")
         else:
@@ -663,7 +818,7 @@ class KrytenClient:
         }
 
         try:
-            data = json.dumps(payload).encode("utf-8")
+            data = self._codec.dumps(payload)
             await self._nats.publish(subject, data)
             self._commands_sent += 1
             self.logger.debug(
@@ -2381,6 +2536,10 @@ class KrytenClient:
             avg_event_latency_ms=avg_latency,
             last_event_time=self._last_event_time,
             handlers_registered=sum(len(handlers) for handlers in self._handlers.values()),
+            handler_queue_depth=self._dispatcher.queue_depth,
+            active_handlers=self._dispatcher.active,
+            dropped_handler_jobs=self._dispatcher.dropped,
+            events_skipped=self._events_skipped,
         )
 
     @property
@@ -2408,74 +2567,329 @@ class KrytenClient:
         if self._nats is None:
             raise KrytenConnectionError("NATS client not initialized")
 
+        if self.config.jetstream is not None:
+            await self._setup_jetstream_intake()
+            return
+
+        await self._sync_subscriptions()
+
+    async def _setup_jetstream_intake(self) -> None:
+        """Bind durable pull consumers and start their fetch loops.
+
+        One durable consumer named ``{durable}_{channel}`` is bound per
+        configured channel, filtered on ``kryten.events.cytube.{channel}.>``.
+        Replicas using the same durable name share the consumer's messages, so
+        ``subscribe_per_event`` and queue groups do not apply in this mode.
+        """
+        if self._nats is None or self.config.jetstream is None:
+            return
+        js_config = self.config.jetstream
+        js = self._nats.jetstream()
+
+        for channel_config in self.config.channels:
+            channel_normalized = normalize_token(channel_config.channel)
+            subject = f"{SUBJECT_PREFIX}.cytube.{channel_normalized}.>"
+            durable = f"{js_config.durable}_{channel_normalized}"
+
+            self.logger.info(f"Binding JetStream consumer {durable} on {subject}")
+            psub = await js.pull_subscribe(
+                subject,
+                durable=durable,
+                stream=js_config.stream,
+                config=ConsumerConfig(
+                    ack_policy=AckPolicy.EXPLICIT,
+                    ack_wait=js_config.ack_wait,
+                    max_ack_pending=js_config.max_ack_pending,
+                ),
+            )
+            self._subscriptions.append(psub)
+            self._intake_tasks.append(
+                asyncio.create_task(self._jetstream_fetch_loop(psub, js_config))
+            )
+
+    async def _jetstream_fetch_loop(self, psub: Any, js_config: JetStreamConfig) -> None:
+        """Fetch batches from a pull consumer and ack each message after its handlers.
+
+        Messages of a batch are processed concurrently; the next batch is fetched
+        once every message of the current one has been handled and acked.
+        """
+        batch_size = js_config.batch_size
+        fetch_timeout = js_config.fetch_timeout
+
+        async def process(msg: Any) -> None:
+            # Handlers must finish before the ack, so always wait for them here
+            await self._on_message(msg, wait=True)
+            try:
+                await msg.ack()
+            except Exception as e:
+                self.logger.warning(f"Failed to ack JetStream message: {e}")
+
+        while True:
+            try:
+                msgs = await psub.fetch(batch_size, timeout=fetch_timeout)
+            except asyncio.TimeoutError:
+                continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._errors += 1
+                self.logger.error(f"JetStream fetch failed: {e}")
+                await asyncio.sleep(fetch_timeout)
+                continue
+
+            await asyncio.gather(*(process(msg) for msg in msgs))
+
+    async def _stop_jetstream_intake(self) -> None:
+        """Cancel the JetStream fetch loops."""
+        tasks, self._intake_tasks = self._intake_tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _event_subjects(self) -> set[tuple[str, bool | None]]:
+        """Compute the event subscriptions this client needs.
+
+        By default every configured channel is subscribed with a wildcard
+        (``kryten.events.cytube.{channel}.>``). With ``subscribe_per_event``
+        enabled, only ``kryten.events.cytube.{channel}.{event}`` subjects with a
+        registered handler are returned, falling back to the channel wildcard
+        when a catch-all (``"*"``) handler accepts that channel.
+
+        Returns:
+            Set of ``(subject, broadcast)`` pairs. ``broadcast`` is None when load
+            balancing is off; otherwise False for the queue-group subscription
+            feeding shared handlers and True for the plain subscription feeding
+            ``broadcast=True`` handlers.
+        """
+        subjects: set[tuple[str, bool | None]] = set()
+        per_event = self.config.subscribe_per_event
+        deliveries: tuple[bool | None, ...] = (False, True) if self._queue_group else (None,)
         for channel_config in self.config.channels:
-            # Subscribe to all events from this channel using wildcard
-            # Format: kryten.events.cytube.{channel}.>
             # Channel is normalized (lowercase, dots removed)
             channel_normalized = channel_config.channel.lower().replace(".", "")
-            subject = f"{SUBJECT_PREFIX}.cytube.{channel_normalized}.>"
+            prefix = f"{SUBJECT_PREFIX}.cytube.{channel_normalized}"
+
+            for broadcast in deliveries:
+                accepting = {
+                    event_name
+                    for event_name, entries in self._handlers.items()
+                    if any(
+                        (not entry.channel or entry.channel == channel_config.channel)
+                        and (not entry.domain or entry.domain == channel_config.domain)
+                        and (broadcast is None or entry.broadcast == broadcast)
+                        for entry in entries
+                    )
+                }
+                if broadcast and not accepting:
+                    continue
+                if not per_event or _CATCH_ALL in accepting:
+                    subjects.add((f"{prefix}.>", broadcast))
+                    continue
+                for event_name in accepting:
+                    token = normalize_token(event_name)
+                    if token:
+                        subjects.add((f"{prefix}.{token}", broadcast))
+        return subjects
+
+    async def _sync_subscriptions(self) -> None:
+        """Subscribe to newly needed event subjects and drop obsolete ones."""
+        async with self._subscription_lock:
+            if self._nats is None:
+                return
+            wanted = self._event_subjects()
+
+            for subject, broadcast in sorted(
+                wanted - self._event_subscriptions.keys(), key=lambda item: item[0]
+            ):
+                callback: Callable[[Any], Awaitable[None]] = self._on_message
+                queue = ""
+                if broadcast is not None:
+                    callback = functools.partial(self._on_message, broadcast=broadcast)
+                    queue = "" if broadcast else self._queue_group
+                self.logger.info(
+                    f"Subscribing to: {subject}" + (f" (queue {queue})" if queue else "")
+                )
+                sub = await self._nats.subscribe(subject, queue=queue, cb=callback)
+                self._event_subscriptions[(subject, broadcast)] = sub
+                self._subscriptions.append(sub)
+
+            for key in sorted(self._event_subscriptions.keys() - wanted, key=lambda item: item[0]):
+                self.logger.info(f"Unsubscribing from: {key[0]}")
+                sub = self._event_subscriptions.pop(key)
+                await self.unsubscribe(sub)
+
+    def _schedule_subscription_sync(self) -> None:
+        """Update event subscriptions in the background after a handler is registered."""
+        task = asyncio.create_task(self._sync_subscriptions())
+        self._subscription_tasks.add(task)
+        task.add_done_callback(self._subscription_tasks.discard)
+
+    def _index_event_handlers(self, event_name: str) -> None:
+        """Precompile the handler lists of one event for every configured channel.
+
+        Called when a handler for ``event_name`` is registered, so only that
+        event's entries are rebuilt. Only configured channel/domain pairs are
+        indexed; the index therefore cannot grow from values seen on the wire.
+        """
+        for channel_config in self.config.channels:
+            channel, domain = channel_config.channel, channel_config.domain
+            if self._queue_group:
+                for broadcast in (False, True):
+                    self._dispatch_index[
+                        (event_name, channel, domain, broadcast)
+                    ] = self._match_handlers(event_name, channel, domain, broadcast)
+            else:
+                self._dispatch_index[(event_name, channel, domain)] = self._match_handlers(
+                    event_name, channel, domain
+                )
+
+    def _match_handlers(
+        self, event_name: str, channel: str, domain: str, broadcast: bool | None = None
+    ) -> tuple[Callable[[Any], Any], ...]:
+        """Scan registered handlers for those whose filters accept an event.
+
+        Handlers registered for the event come first, then catch-all handlers.
+        ``broadcast`` restricts the result to broadcast (True) or shared (False)
+        handlers; None matches both.
+        """
+        entries = list(self._handlers.get(event_name, ()))
+        if event_name != _CATCH_ALL:
+            entries.extend(self._handlers.get(_CATCH_ALL, ()))
+        return tuple(
+            entry.handler
+            for entry in entries
+            if (not entry.channel or entry.channel == channel)
+            and (not entry.domain or entry.domain == domain)
+            and (broadcast is None or entry.broadcast == broadcast)
+        )
+
+    def _resolve_handlers(
+        self, event_name: str, channel: str, domain: str, broadcast: bool | None = None
+    ) -> tuple[Callable[[Any], Any], ...]:
+        """Return the handlers matching an event, using the dispatch index.
+
+        Events from configured channels resolve with a single dict lookup.
+        Anything else (an unconfigured channel/domain, or an event with no
+        handlers) falls back to a scan that is not cached.
+
+        Args:
+            event_name: Lowercased event name
+            channel: Channel the event originated from
+            domain: Domain the event originated from
+            broadcast: Delivery the event arrived on when load balancing
+                       (see ``_event_subjects``); None otherwise
+
+        Returns:
+            Tuple of handlers whose filters accept the event, in registration order
+        """
+        key = (
+            (event_name, channel, domain)
+            if broadcast is None
+            else (event_name, channel, domain, broadcast)
+        )
+        handlers = self._dispatch_index.get(key)
+        if handlers is None:
+            handlers = self._match_handlers(event_name, channel, domain, broadcast)
+        return handlers
 
-            self.logger.info(f"Subscribing to: {subject}")
+    def _ordering_key(
+        self, handler: Callable, raw_event: RawEvent | FastRawEvent
+    ) -> Hashable | None:
+        """Build the dispatcher ordering key for a pipelined handler job.
 
-            sub = await self._nats.subscribe(subject, cb=self._on_message)
-            self._subscriptions.append(sub)
+        Args:
+            handler: Handler the job will run
+            raw_event: Event being dispatched
+
+        Returns:
+            None when ordering is disabled, otherwise a key that is equal for
+            jobs which must run sequentially
+        """
+        ordering = self.config.dispatch_ordering
+        if ordering == "none":
+            return None
+        if ordering == "channel":
+            return (handler, raw_event.domain, raw_event.channel)
+
+        payload = raw_event.payload
+        username = None
+        if isinstance(payload, dict):
+            user = payload.get("user")
+            if isinstance(user, dict):
+                username = user.get("name")
+            else:
+                username = payload.get("username") or payload.get("name")
+        return (handler, raw_event.domain, raw_event.channel, username)
 
-    async def _on_message(self, msg: Any) -> None:
-        """Handle incoming NATS message."""
+    async def _on_message(
+        self, msg: Any, broadcast: bool | None = None, wait: bool | None = None
+    ) -> None:
+        """Handle incoming NATS message.
+
+        Args:
+            msg: NATS message
+            broadcast: When load balancing, whether the message arrived on the
+                       broadcast subscription (True) or the queue group (False)
+            wait: Wait for the handlers to finish; defaults to True unless
+                  ``dispatch_mode`` is "pipelined"
+        """
         start_time = time.time()
 
+        # Drop events nobody handles before decoding them. The subject's last
+        # token is the normalized event name (kryten.events.cytube.{channel}.{event}).
+        if _CATCH_ALL not in self._handlers:
+            subject = msg.subject
+            if (
+                subject.startswith(_EVENT_SUBJECT_PREFIX)
+                and subject.rpartition(".")[2] not in self._handled_event_tokens
+            ):
+                self._events_skipped += 1
+                return
+
         try:
             # Parse message
-            data = json.loads(msg.data.decode("utf-8"))
-            raw_event = RawEvent(**data)
+            data = self._codec.loads(msg.data)
+            raw_event = self._event_models.raw(**data)
 
             self._events_received += 1
             self._last_event_time = datetime.now(timezone.utc)
             self._channel_metrics[f"{raw_event.domain}/{raw_event.channel}"] += 1
 
-            # Find matching handlers
+            # Find matching handlers (single lookup in the precompiled index)
             event_name = raw_event.event_name.lower()
-            handlers = self._handlers.get(event_name, [])
-
-            # Debug logging
-            self.logger.debug(
-                f"Received NATS message: {event_name} from {raw_event.domain}/{raw_event.channel}, "
-                f"found {len(handlers)} handlers"
+            handlers = self._resolve_handlers(
+                event_name, raw_event.channel, raw_event.domain, broadcast
             )
 
-            # Invoke handlers concurrently
-            tasks = []
-            for handler, channel_filter, domain_filter in handlers:
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
-                    f"Checking handler {handler.__name__}: channel_filter={channel_filter}, "
-                    f"domain_filter={domain_filter}, event.channel={raw_event.channel}, "
-                    f"event.domain={raw_event.domain}"
+                    f"Received NATS message: {event_name} from "
+                    f"{raw_event.domain}/{raw_event.channel}, found {len(handlers)} handlers"
                 )
-                # Check filters
-                if channel_filter and channel_filter != raw_event.channel:
-                    self.logger.debug(
-                        f"Handler filtered out by channel: {channel_filter} != {raw_event.channel}"
-                    )
-                    continue
-                if domain_filter and domain_filter != raw_event.domain:
-                    self.logger.debug(
-                        f"Handler filtered out by domain: {domain_filter} != {raw_event.domain}"
-                    )
-                    continue
 
-                # Create task for handler
-                self.logger.debug(f"Creating task for handler: {handler.__name__}")
-                task = asyncio.create_task(self._invoke_handler(handler, raw_event))
-                tasks.append(task)
-
-            # Wait for all handlers
-            self.logger.debug(f"Waiting for {len(tasks)} handler tasks")
-            if tasks:
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                # Log any exceptions from gather
-                for i, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        self.logger.error(f"Handler task {i} raised: {result}", exc_info=result)
+            # Run handlers on the bounded worker pool. The typed event is
+            # converted lazily, once, and shared by all handlers.
+            if handlers:
+                event = _LazyTypedEvent(raw_event, self._convert_to_typed_event)
+                if wait is None:
+                    wait = self.config.dispatch_mode != "pipelined"
+                if not wait:
+                    # Hand the jobs off and return so the next message can be read.
+                    # Jobs sharing an ordering key still run in arrival order.
+                    for handler in handlers:
+                        key = self._ordering_key(handler, raw_event)
+                        await self._dispatcher.submit(handler, event, key=key)
+                else:
+                    # nats-py delivers one message at a time per subscription and
+                    # we wait here, so the queue only ever holds this message's
+                    # handlers (one batch per subscription); overflow policies
+                    # apply to that batch.
+                    waiters = []
+                    for handler in handlers:
+                        done = await self._dispatcher.submit(handler, event, wait=True)
+                        if done is not None:
+                            waiters.append(done)
+                    await asyncio.gather(*waiters)
 
             # Track latency
             elapsed = time.time() - start_time
@@ -2488,7 +2902,7 @@ class KrytenClient:
             self._errors += 1
             self.logger.error(f"Error processing message: {e}", exc_info=True)
 
-    def _convert_to_typed_event(self, raw_event: RawEvent) -> Any:
+    def _convert_to_typed_event(self, raw_event: RawEvent | FastRawEvent) -> Any:
         """Convert RawEvent to specific typed event based on event_name.
 
         Args:
@@ -2499,9 +2913,11 @@ class KrytenClient:
 
         Note:
             Falls back to returning the RawEvent if conversion fails or event type is unknown.
+            With ``fast_models`` enabled the unvalidated ``kryten.fast_models`` classes are built.
         """
         event_name = raw_event.event_name.lower()
         payload = raw_event.payload
+        models = self._event_models
 
         # Skip conversion if payload is not a dictionary
         if not isinstance(payload, dict):
@@ -2532,7 +2948,7 @@ class KrytenClient:
                 meta = payload.get("meta", {})
                 shadow = bool(meta.get("shadow", False)) if isinstance(meta, dict) else False
 
-                return ChatMessageEvent(
+                return models.chat(
                     username=username,
                     message=message,
                     timestamp=timestamp,
@@ -2564,7 +2980,7 @@ class KrytenClient:
                 meta = payload.get("meta", {})
                 shadow = bool(meta.get("shadow", False)) if isinstance(meta, dict) else False
 
-                return ChatMessageEvent(
+                return models.chat(
                     username=username,
                     message=message,
                     timestamp=timestamp,
@@ -2585,7 +3001,7 @@ class KrytenClient:
                     else raw_event.timestamp
                 )
 
-                return UserJoinEvent(
+                return models.user_join(
                     username=username,
                     rank=rank,
                     timestamp=timestamp,
@@ -2603,7 +3019,7 @@ class KrytenClient:
                     else raw_event.timestamp
                 )
 
-                return UserLeaveEvent(
+                return models.user_leave(
                     username=username,
                     timestamp=timestamp,
                     channel=raw_event.channel,
@@ -2624,7 +3040,7 @@ class KrytenClient:
                     else raw_event.timestamp
                 )
 
-                return ChangeMediaEvent(
+                return models.change_media(
                     media_type=media_type,
                     media_id=media_id,
                     title=title,
@@ -2646,7 +3062,7 @@ class KrytenClient:
                     else raw_event.timestamp
                 )
 
-                return PlaylistUpdateEvent(
+                return models.playlist_update(
                     action=action,
                     uid=uid,
                     timestamp=timestamp,
@@ -2664,11 +3080,11 @@ class KrytenClient:
         # Default: return raw event if conversion fails or event type unknown
         return raw_event
 
-    async def _invoke_handler(self, handler: Callable[[Any], Any], event: RawEvent) -> None:
+    async def _invoke_handler(self, handler: Callable[[Any], Any], event: _LazyTypedEvent) -> None:
         """Invoke event handler with timeout."""
         try:
-            # Convert RawEvent to specific typed event based on event_name
-            typed_event = self._convert_to_typed_event(event)
+            # Typed event is converted on first use and shared across handlers
+            typed_event = event.get()
             await asyncio.wait_for(
                 handler(typed_event),
                 timeout=self.config.handler_timeout,
@@ -2778,10 +3194,10 @@ class KrytenClient:
 
         try:
             response = await nats_client.request(
-                subject=subject, payload=json.dumps(request).encode(), timeout=timeout
+                subject=subject, payload=self._codec.dumps(request), timeout=timeout
             )
 
-            result = json.loads(response.data.decode("utf-8"))
+            result = self._codec.loads(response.data)
             if result.get("success"):
                 return result.get("data", {}).get("user")  # type: ignore
             else:
@@ -2838,10 +3254,10 @@ class KrytenClient:
 
         try:
             response = await nats_client.request(
-                subject=subject, payload=json.dumps(request).encode(), timeout=timeout
+                subject=subject, payload=self._codec.dumps(request), timeout=timeout
             )
 
-            result = json.loads(response.data.decode("utf-8"))
+            result = self._codec.loads(response.data)
             if result.get("success"):
                 return result.get("data", {}).get("profile")  # type: ignore
             else:
@@ -2895,10 +3311,10 @@ class KrytenClient:
 
         try:
             response = await nats_client.request(
-                subject=subject, payload=json.dumps(request).encode(), timeout=timeout
+                subject=subject, payload=self._codec.dumps(request), timeout=timeout
             )
 
-            result = json.loads(response.data.decode("utf-8"))
+            result = self._codec.loads(response.data)
             if result.get("success"):
                 return result.get("data", {}).get("profiles", {})  # type: ignore
             else:
@@ -2961,10 +3377,10 @@ class KrytenClient:
 
         try:
             response = await self._nats.request(
-                subject=subject, payload=json.dumps({}).encode(), timeout=timeout
+                subject=subject, payload=self._codec.dumps({}), timeout=timeout
             )
 
-            result = json.loads(response.data.decode("utf-8"))
+            result = self._codec.loads(response.data)
             return result  # type: ignore
 
         except asyncio.TimeoutError:
@@ -3067,7 +3483,7 @@ class KrytenClient:
         nats_client = self._nats
 
         kv = await get_kv_store(nats_client, bucket_name)
-        return await kv_get(kv, key, default=default, parse_json=parse_json)
+        return await kv_get(kv, key, default=default, parse_json=parse_json, codec=self._codec)
 
     async def kv_put(self, bucket_name: str, key: str, value: Any, as_json: bool = False) -> None:
         """Put value into KeyValue store.
@@ -3089,7 +3505,7 @@ class KrytenClient:
         nats_client = self._nats
 
         kv = await get_kv_store(nats_client, bucket_name)
-        await kv_put(kv, key, value, as_json=as_json)
+        await kv_put(kv, key, value, as_json=as_json, codec=self._codec)
 
     async def kv_delete(self, bucket_name: str, key: str) -> None:
         """Delete key from KeyValue store.
@@ -3151,7 +3567,7 @@ class KrytenClient:
         nats_client = self._nats
 
         kv = await get_kv_store(nats_client, bucket_name)
-        return await kv_get_all(kv, parse_json=parse_json)
+        return await kv_get_all(kv, parse_json=parse_json, codec=self._codec)
 
     # Kryten-Robot State KV helpers
 
@@ -3458,31 +3874,34 @@ class KrytenClient:
         if not self._nats:
             raise KrytenConnectionError("Not connected to NATS")
 
-        # Capture client for closure to satisfy mypy
+        # Capture client and codec for closure to satisfy mypy
         nats_client = self._nats
+        codec = self._codec
 
         async def nats_handler(msg):
             """Wrapper to handle NATS message and send reply."""
             try:
                 # Parse request
-                request = json.loads(msg.data.decode("utf-8"))
+                request = codec.loads(msg.data)
+            except ValueError as e:
+                self.logger.error("Invalid JSON in request: %s", e)
+                error_response = codec.dumps({"error": "Invalid JSON"})
+                if msg.reply:
+                    await nats_client.publish(msg.reply, error_response)
+                return
 
+            try:
                 # Call handler
                 response = await handler(request)
 
                 # Send reply
-                reply_payload = json.dumps(response).encode("utf-8")
+                reply_payload = codec.dumps(response)
                 await nats_client.publish(msg.reply, reply_payload)
 
-            except json.JSONDecodeError as e:
-                self.logger.error("Invalid JSON in request: %s", e)
-                error_response = json.dumps({"error": "Invalid JSON"}).encode("utf-8")
-                if msg.reply:
-                    await nats_client.publish(msg.reply, error_response)
             except Exception:  # noqa: BLE001
                 self.logger.exception("Error in request handler")
                 # Send error response
-                error_response = json.dumps({"error": "Internal error"}).encode("utf-8")
+                error_response = codec.dumps({"error": "Internal error"})
                 if msg.reply:
                     await nats_client.publish(msg.reply, error_response)
 
@@ -3527,9 +3946,9 @@ class KrytenClient:
         nats_client = self._nats
 
         try:
-            payload = json.dumps(request).encode("utf-8")
+            payload = self._codec.dumps(request)
             response = await nats_client.request(subject, payload, timeout=timeout)
-            return cast(dict[str, Any], json.loads(response.data.decode("utf-8")))
+            return cast(dict[str, Any], self._codec.loads(response.data))
         except asyncio.TimeoutError as e:
             raise TimeoutError(f"NATS request timeout on {subject}") from e
 
@@ -0,0 +1,157 @@
+"""Pluggable JSON Codecs.
+
+This module provides the JSON encoder/decoder used for everything Kryten puts
+on or reads from NATS. The stdlib ``json`` module is always available; the
+faster ``orjson`` and ``msgspec`` backends are used when installed.
+
+Codecs work on bytes: ``dumps()`` returns UTF-8 bytes ready to publish and
+``loads()`` accepts the raw message bytes without a ``.decode("utf-8")`` copy.
+Decode failures raise ``ValueError`` for every backend.
+
+Examples:
+    >>> codec = get_codec("auto")
+    >>> codec.name
+    'orjson'
+    >>> codec.loads(codec.dumps({"command": "chat"}))
+    {'command': 'chat'}
+
+Install the optional backends with ``pip install kryten-py[orjson]`` or
+``pip install kryten-py[msgspec]``.
+"""
+
+import json
+from typing import Any, Literal
+
+CodecName = Literal["auto", "json", "orjson", "msgspec"]
+"""Codec selector accepted by get_codec() and KrytenConfig.json_codec."""
+
+
+class JsonCodec:
+    """Stdlib ``json`` codec; the fallback when no faster backend is installed.
+
+    Attributes:
+        name: Backend name.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode JSON from bytes or str.
+
+        Raises:
+            ValueError: If the data is not valid JSON.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec backed by ``orjson``.
+
+    Note:
+        orjson rejects non-string dict keys and integers wider than 64 bits,
+        and serializes ``datetime`` objects natively.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        return self._dumps(obj)  # type: ignore[no-any-return]
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode JSON from bytes or str.
+
+        Raises:
+            ValueError: If the data is not valid JSON.
+        """
+        return self._loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """Codec backed by ``msgspec.json``."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        return self._encoder.encode(obj)  # type: ignore[no-any-return]
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode JSON from bytes or str.
+
+        Raises:
+            ValueError: If the data is not valid JSON.
+        """
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e)) from e
+
+
+_BACKENDS: dict[str, type[JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JsonCodec,
+}
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """Return a codec instance by name.
+
+    Args:
+        name: "json", "orjson", "msgspec", or "auto" to pick the fastest
+              installed backend (orjson, then msgspec, then json).
+
+    Returns:
+        Codec instance.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the named backend is not installed.
+    """
+    if name == "auto":
+        for backend in _BACKENDS.values():
+            try:
+                return backend()
+            except ImportError:
+                continue
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown JSON codec: {name!r} (expected auto, json, orjson or msgspec)")
+    try:
+        return _BACKENDS[name]()
+    except ImportError as e:
+        raise ImportError(
+            f"JSON codec {name!r} requires the {name} package. "
+            f"Install it with: pip install kryten-py[{name}]"
+        ) from e
+
+
+DEFAULT_CODEC = JsonCodec()
+"""Stdlib codec used by helpers when no codec is passed."""
+
+
+__all__ = [
+    "CodecName",
+    "JsonCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "get_codec",
+    "DEFAULT_CODEC",
+]
@@ -3,6 +3,7 @@
 import json
 import os
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -94,6 +95,38 @@ class MetricsConfig(BaseModel):
     metrics_path: str = Field("/metrics", description="Path for metrics endpoint")
 
 
+class JetStreamConfig(BaseModel):
+    """JetStream durable pull-consumer intake configuration.
+
+    When set on ``KrytenConfig.jetstream``, events are fetched in batches from
+    a durable pull consumer on the bridge's event stream (one consumer per
+    configured channel) and acknowledged after their handlers finish, instead
+    of arriving through core NATS subscriptions.
+
+    Attributes:
+        stream: Name of the JetStream stream holding bridge events
+        durable: Durable consumer name prefix (replicas sharing it share the work)
+        batch_size: Maximum messages per fetch
+        max_ack_pending: Maximum unacknowledged messages outstanding per consumer
+        ack_wait: Seconds before an unacknowledged message is redelivered
+        fetch_timeout: Seconds a fetch waits for messages before retrying
+
+    Examples:
+        >>> jetstream = JetStreamConfig(stream="KRYTEN_EVENTS", durable="mybot")
+    """
+
+    stream: str = Field(..., description="JetStream stream holding bridge events")
+    durable: str = Field(..., description="Durable consumer name prefix")
+    batch_size: int = Field(100, description="Maximum messages per fetch", ge=1)
+    max_ack_pending: int = Field(
+        1000, description="Maximum unacknowledged messages per consumer", ge=1
+    )
+    ack_wait: float = Field(
+        60.0, description="Seconds before an unacknowledged message is redelivered", gt=0
+    )
+    fetch_timeout: float = Field(1.0, description="Seconds a fetch waits for messages", gt=0)
+
+
 class ServiceConfig(BaseModel):
     """Service identity and lifecycle configuration.
 
@@ -108,6 +141,9 @@ class ServiceConfig(BaseModel):
         health_path: Path for health endpoint (default: /health)
         metrics_port: Port for metrics endpoint (defaults to health_port)
         metrics_path: Path for metrics endpoint (default: /metrics)
+        load_balance: Join a NATS queue group named after the service so event
+            handlers are load-balanced across replicas (opt out per handler with
+            ``on(..., broadcast=True)``)
 
     Examples:
         >>> service = ServiceConfig(name="userstats", version="1.0.0")
@@ -131,6 +167,9 @@ class ServiceConfig(BaseModel):
         None, description="Port for metrics endpoint (defaults to health_port)"
     )
     metrics_path: str = Field("/metrics", description="Path for metrics endpoint")
+    load_balance: bool = Field(
+        False, description="Share events across replicas via a queue group named after the service"
+    )
 
     @field_validator("name")
     @classmethod
@@ -152,7 +191,22 @@ class KrytenConfig(BaseModel):
         retry_attempts: Command retry attempts
         retry_delay: Initial retry delay in seconds
         handler_timeout: Max handler execution time
-        max_concurrent_handlers: Max concurrent handlers
+        max_concurrent_handlers: Max concurrent handlers (size of the handler worker pool)
+        handler_queue_size: Max handler invocations waiting for a worker
+        handler_overflow_policy: What to do when the handler queue is full:
+            "block", "drop_oldest" or "drop_newest"
+        dispatch_mode: "wait" to finish an event's handlers before reading the next
+            message, or "pipelined" to hand events to the worker pool and return
+        dispatch_ordering: Ordering guarantee in pipelined mode: "none",
+            "channel" (per handler and channel) or "user" (per handler, channel
+            and username)
+        json_codec: JSON codec for NATS payloads: "auto" (fastest installed),
+            "json", "orjson" or "msgspec"
+        fast_models: Build inbound events as unvalidated ``__slots__`` classes
+            (``kryten.fast_models``) instead of pydantic models; for trusted bridges
+        subscribe_per_event: Subscribe only to the event subjects that have
+            registered handlers instead of each channel's ``>`` wildcard
+        jetstream: Optional JetStream pull-consumer intake (replaces core subscriptions)
         log_level: Logging level
 
     Examples:
@@ -175,6 +229,36 @@ class KrytenConfig(BaseModel):
     retry_delay: float = Field(1.0, description="Initial retry delay in seconds", ge=0.1)
     handler_timeout: float = Field(30.0, description="Max handler execution time", ge=1.0)
     max_concurrent_handlers: int = Field(1000, description="Max concurrent handlers", ge=1)
+    handler_queue_size: int = Field(
+        10000, description="Max handler invocations waiting for a worker", ge=1
+    )
+    handler_overflow_policy: Literal["block", "drop_oldest", "drop_newest"] = Field(
+        "block",
+        description="Policy when the handler queue is full: block, drop_oldest, drop_newest",
+    )
+    dispatch_mode: Literal["wait", "pipelined"] = Field(
+        "wait",
+        description="wait: finish handlers before the next message; pipelined: return at once",
+    )
+    dispatch_ordering: Literal["none", "channel", "user"] = Field(
+        "none",
+        description="Ordering guarantee for pipelined dispatch: none, channel or user",
+    )
+    json_codec: Literal["auto", "json", "orjson", "msgspec"] = Field(
+        "auto",
+        description="JSON codec for NATS payloads: auto picks orjson, then msgspec, then json",
+    )
+    fast_models: bool = Field(
+        False,
+        description="Skip pydantic validation of inbound events (trusted bridge payloads)",
+    )
+    subscribe_per_event: bool = Field(
+        False,
+        description="Subscribe only to event subjects with registered handlers",
+    )
+    jetstream: JetStreamConfig | None = Field(
+        None, description="JetStream durable pull-consumer intake settings"
+    )
     log_level: str = Field("INFO", description="Logging level")
     chat_min_delay: float = Field(
         1.0,
@@ -281,5 +365,6 @@ __all__ = [
     "NatsConfig",
     "ChannelConfig",
     "ServiceConfig",
+    "JetStreamConfig",
     "KrytenConfig",
 ]
@@ -0,0 +1,284 @@
+"""Bounded Worker-Pool Dispatcher for Event Handlers.
+
+This module provides the dispatcher KrytenClient uses to run event handlers.
+Instead of creating one asyncio task per handler invocation, jobs are placed
+on a bounded queue and executed by a capped pool of worker coroutines, so an
+event flood cannot create an unbounded number of tasks.
+
+Overflow Policies
+-----------------
+When the queue is full, the configured policy decides what happens:
+
+- ``block``: ``submit()`` waits for space (backpressure on the NATS callback)
+- ``drop_oldest``: the oldest queued job is discarded to make room
+- ``drop_newest``: the new job is discarded
+
+Dropped jobs are counted and exposed through ``KrytenClient.health()``.
+
+Ordering
+--------
+Jobs submitted with the same ``key`` run one at a time, in submission order.
+Jobs with different keys (or no key) run concurrently. Jobs waiting behind a
+running job with the same key count towards the queue limit.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Literal
+
+OverflowPolicy = Literal["block", "drop_oldest", "drop_newest"]
+"""Queue overflow policy for HandlerDispatcher."""
+
+OVERFLOW_POLICIES: tuple[str, ...] = ("block", "drop_oldest", "drop_newest")
+"""Valid overflow policy names."""
+
+_Job = tuple[Callable[[Any], Any], Any, "asyncio.Future | None", Hashable | None]
+
+
+class HandlerDispatcher:
+    """Run handler invocations on a fixed-size pool of worker coroutines.
+
+    Workers are spawned on demand, up to ``max_workers``, and then kept for
+    the life of the dispatcher. At most ``max_workers`` handlers run
+    concurrently and at most ``max_queue`` jobs wait for a worker.
+
+    Attributes:
+        dropped: Number of jobs discarded by the overflow policy.
+        processed: Number of jobs that ran to completion (cancelled jobs excluded).
+
+    Examples:
+        >>> dispatcher = HandlerDispatcher(invoke, max_workers=100, max_queue=1000)
+        >>> done = await dispatcher.submit(handler, event, wait=True)
+        >>> await done
+        >>> await dispatcher.submit(handler, event, key=("lounge", handler))
+        >>> await dispatcher.stop()
+    """
+
+    def __init__(
+        self,
+        invoke: Callable[[Callable[[Any], Any], Any], Awaitable[None]],
+        max_workers: int,
+        max_queue: int,
+        overflow: str = "block",
+        logger: logging.Logger | None = None,
+    ) -> None:
+        """Initialize dispatcher.
+
+        Args:
+            invoke: Coroutine function called as ``invoke(handler, event)`` for each job.
+            max_workers: Maximum number of worker coroutines.
+            max_queue: Maximum number of queued jobs.
+            overflow: Overflow policy: "block", "drop_oldest" or "drop_newest".
+            logger: Optional logger for error reporting.
+
+        Raises:
+            ValueError: If overflow policy is unknown or limits are not positive.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy: {overflow!r} (expected one of {OVERFLOW_POLICIES})"
+            )
+        if max_workers < 1 or max_queue < 1:
+            raise ValueError("max_workers and max_queue must be at least 1")
+
+        self._invoke = invoke
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._overflow = overflow
+        self._logger = logger or logging.getLogger(__name__)
+
+        # Jobs ready to run; the max_queue bound is enforced by submit()
+        self._queue: asyncio.Queue[_Job] = asyncio.Queue()
+        # Ordering lanes: a key is present while a job with that key is queued or
+        # running; the deque holds later jobs with the same key
+        self._lanes: dict[Hashable, deque[_Job]] = {}
+        self._lane_backlog = 0
+        self._space_waiters: deque[asyncio.Future] = deque()
+
+        self._workers: set[asyncio.Task] = set()
+        self._idle = 0
+        # Bumped by stop(); workers from an older generation exit their loop
+        self._generation = 0
+
+        self.dropped = 0
+        self.processed = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a worker (including ordered backlog)."""
+        return self._queue.qsize() + self._lane_backlog
+
+    @property
+    def active(self) -> int:
+        """Number of workers currently running a handler."""
+        return len(self._workers) - self._idle
+
+    @property
+    def workers(self) -> int:
+        """Number of worker coroutines spawned so far."""
+        return len(self._workers)
+
+    async def submit(
+        self,
+        handler: Callable[[Any], Any],
+        event: Any,
+        wait: bool = False,
+        key: Hashable | None = None,
+    ) -> asyncio.Future | None:
+        """Queue a handler invocation.
+
+        Args:
+            handler: Event handler to run.
+            event: Event passed to ``invoke`` along with the handler.
+            wait: If True, return a future resolved when the job finishes
+                  (or is dropped).
+            key: Optional ordering key; jobs sharing a key run sequentially
+                 in submission order.
+
+        Returns:
+            Completion future if ``wait`` is True, otherwise None.
+        """
+        future = asyncio.get_running_loop().create_future() if wait else None
+
+        while self.queue_depth >= self._max_queue:
+            if self._overflow == "block":
+                waiter = asyncio.get_running_loop().create_future()
+                self._space_waiters.append(waiter)
+                await waiter
+                continue
+            self.dropped += 1
+            if self._overflow == "drop_newest":
+                _resolve(future)
+                return future
+            self._drop_oldest()
+
+        job: _Job = (handler, event, future, key)
+        if key is not None:
+            lane = self._lanes.get(key)
+            if lane is not None:
+                # A job with this key is queued or running; wait behind it
+                lane.append(job)
+                self._lane_backlog += 1
+                return future
+            self._lanes[key] = deque()
+
+        self._queue.put_nowait(job)
+
+        # Spawn another worker if queued work outnumbers idle workers
+        if self._queue.qsize() > self._idle and len(self._workers) < self._max_workers:
+            task = asyncio.create_task(self._worker())
+            self._workers.add(task)
+            task.add_done_callback(self._workers.discard)
+
+        return future
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Discard queued jobs and shut down all workers.
+
+        Workers are cancelled repeatedly until they exit or ``timeout`` expires,
+        since a handler may swallow a single cancellation (e.g. when
+        ``asyncio.wait_for`` completes at the same moment it is cancelled).
+        Workers still alive after the timeout are abandoned with a warning.
+
+        Args:
+            timeout: Maximum seconds to wait for workers to exit.
+        """
+        self._generation += 1
+
+        while not self._queue.empty():
+            _resolve(self._queue.get_nowait()[2])
+        for lane in self._lanes.values():
+            for job in lane:
+                _resolve(job[2])
+        self._lanes.clear()
+        self._lane_backlog = 0
+        self._wake_space_waiters()
+
+        pending = set(self._workers)
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._logger.warning(
+                    f"{len(pending)} handler worker(s) did not stop within {timeout}s"
+                )
+                break
+            for task in pending:
+                task.cancel()
+            _, pending = await asyncio.wait(pending, timeout=min(remaining, 0.1))
+
+        self._workers.clear()
+
+    def _drop_oldest(self) -> None:
+        """Discard the oldest waiting job to make room for a new one."""
+        if not self._queue.empty():
+            _, _, future, key = self._queue.get_nowait()
+            _resolve(future)
+            if key is not None:
+                # The dropped job held its lane; let the next one in line run
+                self._advance_lane(key)
+            return
+        # Everything in the ready queue is running; drop from an ordered backlog
+        for lane in self._lanes.values():
+            if lane:
+                _resolve(lane.popleft()[2])
+                self._lane_backlog -= 1
+                return
+
+    def _advance_lane(self, key: Hashable) -> _Job | None:
+        """Release a lane after its head job, returning the next job if any."""
+        lane = self._lanes.get(key)
+        if not lane:
+            self._lanes.pop(key, None)
+            return None
+        job = lane.popleft()
+        self._lane_backlog -= 1
+        self._queue.put_nowait(job)
+        return job
+
+    def _wake_space_waiters(self) -> None:
+        """Wake submitters blocked on a full queue."""
+        while self._space_waiters:
+            _resolve(self._space_waiters.popleft())
+
+    async def _worker(self) -> None:
+        """Pull jobs from the queue and run them until stopped."""
+        generation = self._generation
+        while generation == self._generation:
+            self._idle += 1
+            try:
+                handler, event, future, key = await self._queue.get()
+            finally:
+                self._idle -= 1
+            self._wake_space_waiters()
+
+            try:
+                await self._invoke(handler, event)
+            except asyncio.CancelledError:
+                # Cancelled jobs are not counted as processed
+                _resolve(future)
+                raise
+            except Exception as e:
+                self._logger.error(f"Handler job raised: {e}", exc_info=True)
+
+            self.processed += 1
+            _resolve(future)
+
+            if key is not None and generation == self._generation:
+                self._advance_lane(key)
+
+
+def _resolve(future: asyncio.Future | None) -> None:
+    """Mark a job completion future as done, if it is still pending."""
+    if future is not None and not future.done():
+        future.set_result(None)
+
+
+__all__ = [
+    "OverflowPolicy",
+    "OVERFLOW_POLICIES",
+    "HandlerDispatcher",
+]
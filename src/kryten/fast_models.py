@@ -0,0 +1,165 @@
+"""Low-overhead event models for trusted inbound events.
+
+These classes mirror the pydantic models in ``kryten.models`` field for field,
+but are ``NamedTuple`` classes (``__slots__ = ()``) that store values as given,
+without validation or coercion. ``KrytenClient`` uses them for inbound events
+when ``KrytenConfig.fast_models`` is enabled, which is appropriate when events
+come from a trusted Kryten bridge that already produces well-formed payloads.
+
+Differences from the pydantic models:
+
+- No validation or type coercion (except ``FastRawEvent.timestamp``, which is
+  parsed from its ISO 8601 wire form by ``FastRawEvent.parse()``)
+- Attribute assignment raises ``AttributeError`` instead of ``ValidationError``
+- They are tuples, not ``BaseModel`` subclasses; ``isinstance`` checks against
+  the pydantic classes fail. ``model_dump()`` is provided.
+
+Examples:
+    >>> event = FastRawEvent.parse(
+    ...     event_name="chatMsg", payload={"msg": "hi"}, channel="lounge",
+    ...     domain="cytu.be", timestamp="2024-01-01T00:00:00+00:00",
+    ... )
+    >>> event.timestamp.year
+    2024
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Any, NamedTuple
+
+
+class FastRawEvent(NamedTuple):
+    """Unvalidated counterpart of ``RawEvent``."""
+
+    event_name: str
+    payload: Any
+    channel: str
+    domain: str
+    timestamp: datetime
+    correlation_id: str
+
+    @classmethod
+    def parse(
+        cls,
+        event_name: str,
+        payload: Any,
+        channel: str,
+        domain: str,
+        timestamp: datetime | str | None = None,
+        correlation_id: str | None = None,
+        **_extra: Any,
+    ) -> "FastRawEvent":
+        """Build from a decoded bridge envelope.
+
+        Parses an ISO 8601 ``timestamp``, applies ``RawEvent``'s defaults for a
+        missing timestamp or correlation ID, and ignores unknown keys.
+        """
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+        elif isinstance(timestamp, str):
+            if timestamp.endswith("Z"):
+                timestamp = timestamp[:-1] + "+00:00"
+            timestamp = datetime.fromisoformat(timestamp)
+        return cls(
+            event_name, payload, channel, domain, timestamp, correlation_id or str(uuid.uuid4())
+        )
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the fields as a dictionary."""
+        return self._asdict()
+
+    def to_bytes(self) -> bytes:
+        """Serialize to UTF-8 encoded JSON bytes."""
+        data = self._asdict()
+        data["timestamp"] = self.timestamp.isoformat()
+        return json.dumps(data).encode("utf-8")
+
+
+class FastChatMessageEvent(NamedTuple):
+    """Unvalidated counterpart of ``ChatMessageEvent``."""
+
+    username: str
+    message: str
+    timestamp: datetime
+    rank: int
+    channel: str
+    domain: str
+    correlation_id: str
+    shadow: bool = False
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the fields as a dictionary."""
+        return self._asdict()
+
+
+class FastUserJoinEvent(NamedTuple):
+    """Unvalidated counterpart of ``UserJoinEvent``."""
+
+    username: str
+    rank: int
+    timestamp: datetime
+    channel: str
+    domain: str
+    correlation_id: str
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the fields as a dictionary."""
+        return self._asdict()
+
+
+class FastUserLeaveEvent(NamedTuple):
+    """Unvalidated counterpart of ``UserLeaveEvent``."""
+
+    username: str
+    timestamp: datetime
+    channel: str
+    domain: str
+    correlation_id: str
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the fields as a dictionary."""
+        return self._asdict()
+
+
+class FastChangeMediaEvent(NamedTuple):
+    """Unvalidated counterpart of ``ChangeMediaEvent``."""
+
+    media_type: str
+    media_id: str
+    title: str
+    duration: int
+    uid: int
+    timestamp: datetime
+    channel: str
+    domain: str
+    correlation_id: str
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the fields as a dictionary."""
+        return self._asdict()
+
+
+class FastPlaylistUpdateEvent(NamedTuple):
+    """Unvalidated counterpart of ``PlaylistUpdateEvent``."""
+
+    action: str
+    timestamp: datetime
+    channel: str
+    domain: str
+    correlation_id: str
+    uid: int | None = None
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the fields as a dictionary."""
+        return self._asdict()
+
+
+__all__ = [
+    "FastRawEvent",
+    "FastChatMessageEvent",
+    "FastUserJoinEvent",
+    "FastUserLeaveEvent",
+    "FastChangeMediaEvent",
+    "FastPlaylistUpdateEvent",
+]
@@ -35,6 +35,10 @@ class HealthStatus(BaseModel):
         avg_event_latency_ms: Average event processing time
         last_event_time: Timestamp of last event
         handlers_registered: Number of event handlers
+        handler_queue_depth: Handler invocations waiting for a worker
+        active_handlers: Handler invocations currently running
+        dropped_handler_jobs: Handler invocations discarded because the queue was full
+        events_skipped: Events dropped unparsed because no handler accepts their subject
     """
 
     connected: bool = Field(..., description="Whether NATS is connected")
@@ -50,6 +54,14 @@ class HealthStatus(BaseModel):
     avg_event_latency_ms: float = Field(..., description="Average event processing time")
     last_event_time: datetime | None = Field(None, description="Timestamp of last event")
     handlers_registered: int = Field(..., description="Number of event handlers")
+    handler_queue_depth: int = Field(0, description="Handler invocations waiting for a worker")
+    active_handlers: int = Field(0, description="Handler invocations currently running")
+    dropped_handler_jobs: int = Field(
+        0, description="Handler invocations discarded because the queue was full"
+    )
+    events_skipped: int = Field(
+        0, description="Events dropped unparsed because no handler accepts their subject"
+    )
 
 
 __all__ = [
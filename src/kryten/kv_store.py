@@ -4,7 +4,6 @@ This module provides helper functions for interacting with NATS JetStream
 KeyValue stores, commonly used by Kryten services for state persistence.
 """
 
-import json
 import logging
 from typing import Any
 
@@ -12,6 +11,8 @@ from nats.aio.client import Client as NATSClient
 from nats.js import JetStreamContext, api
 from nats.js.errors import KeyNotFoundError
 
+from kryten.codec import DEFAULT_CODEC, JsonCodec
+
 
 async def get_kv_store(
     nats_client: NATSClient, bucket_name: str, logger: logging.Logger | None = None
@@ -116,6 +117,7 @@ async def kv_get(
     default: Any = None,
     parse_json: bool = False,
     logger: logging.Logger | None = None,
+    codec: JsonCodec | None = None,
 ) -> Any:
     """Get a value from KeyValue store.
 
@@ -125,6 +127,7 @@ async def kv_get(
         default: Default value if key doesn't exist.
         parse_json: If True, parse value as JSON.
         logger: Optional logger for error reporting.
+        codec: JSON codec used when parse_json is True (default: stdlib json).
 
     Returns:
         Value from store, or default if key doesn't exist.
@@ -141,8 +144,8 @@ async def kv_get(
         value = entry.value
         if parse_json and value:
             try:
-                return json.loads(value.decode("utf-8"))
-            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                return (codec or DEFAULT_CODEC).loads(value)
+            except ValueError as e:
                 if logger:
                     logger.error("Failed to parse JSON for key %s: %s", key, e)
                 return default
@@ -160,7 +163,12 @@ async def kv_get(
 
 
 async def kv_put(
-    kv_store: Any, key: str, value: Any, as_json: bool = False, logger: logging.Logger | None = None
+    kv_store: Any,
+    key: str,
+    value: Any,
+    as_json: bool = False,
+    logger: logging.Logger | None = None,
+    codec: JsonCodec | None = None,
 ) -> bool:
     """Put a value into KeyValue store.
 
@@ -170,6 +178,7 @@ async def kv_put(
         value: Value to store (bytes, str, or dict/list if as_json=True).
         as_json: If True, serialize value as JSON.
         logger: Optional logger for error reporting.
+        codec: JSON codec used when as_json is True (default: stdlib json).
 
     Returns:
         True if successful, False otherwise.
@@ -180,7 +189,7 @@ async def kv_put(
     """
     try:
         if as_json:
-            data = json.dumps(value).encode("utf-8")
+            data = (codec or DEFAULT_CODEC).dumps(value)
         elif isinstance(value, str):
             data = value.encode("utf-8")
         elif isinstance(value, bytes):
@@ -249,7 +258,10 @@ async def kv_keys(kv_store: Any, logger: logging.Logger | None = None) -> list[s
 
 
 async def kv_get_all(
-    kv_store: Any, parse_json: bool = False, logger: logging.Logger | None = None
+    kv_store: Any,
+    parse_json: bool = False,
+    logger: logging.Logger | None = None,
+    codec: JsonCodec | None = None,
 ) -> dict[str, Any]:
     """Get all key-value pairs from KeyValue store.
 
@@ -257,6 +269,7 @@ async def kv_get_all(
         kv_store: KeyValue bucket instance.
         parse_json: If True, parse values as JSON.
         logger: Optional logger for error reporting.
+        codec: JSON codec used when parse_json is True (default: stdlib json).
 
     Returns:
         Dictionary of all key-value pairs.
@@ -270,7 +283,7 @@ async def kv_get_all(
     keys = await kv_keys(kv_store, logger)
 
     for key in keys:
-        value = await kv_get(kv_store, key, parse_json=parse_json, logger=logger)
+        value = await kv_get(kv_store, key, parse_json=parse_json, logger=logger, codec=codec)
         if value is not None:
             result[key] = value
 
@@ -12,7 +12,6 @@ restarts across the service group.
 """
 
 import asyncio
-import json
 import logging
 import socket
 from collections.abc import Callable
@@ -21,6 +20,8 @@ from typing import Any
 
 from nats.aio.client import Client as NATSClient
 
+from kryten.codec import DEFAULT_CODEC, JsonCodec
+
 
 class LifecycleEventPublisher:
     """Publisher for service lifecycle events.
@@ -64,6 +65,7 @@ class LifecycleEventPublisher:
         health_path: str = "/health",
         metrics_port: int | None = None,
         metrics_path: str = "/metrics",
+        codec: JsonCodec | None = None,
     ) -> None:
         """Initialize lifecycle event publisher.
 
@@ -79,6 +81,7 @@ class LifecycleEventPublisher:
             health_path: Path for health endpoint (default: /health).
             metrics_port: Port for metrics endpoint (defaults to health_port).
             metrics_path: Path for metrics endpoint (default: /metrics).
+            codec: JSON codec for published payloads (default: stdlib json).
         """
         self._service_name = service_name
         self._nats = nats_client
@@ -87,6 +90,7 @@ class LifecycleEventPublisher:
         self._heartbeat_interval = heartbeat_interval
         self._enable_heartbeat = enable_heartbeat
         self._enable_discovery = enable_discovery
+        self._codec = codec or DEFAULT_CODEC
 
         self._running = False
         self._subscription: Any = None
@@ -233,7 +237,7 @@ class LifecycleEventPublisher:
     async def _handle_restart_notice(self, msg: Any) -> None:
         """Handle incoming groupwide restart notice."""
         try:
-            data = json.loads(msg.data.decode("utf-8"))
+            data = self._codec.loads(msg.data)
 
             # Extract restart parameters
             initiator = data.get("initiator", "unknown")
@@ -254,7 +258,7 @@ class LifecycleEventPublisher:
                 except Exception as e:
                     self._logger.error("Error in restart callback: %s", e, exc_info=True)
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             self._logger.error("Invalid restart notice JSON: %s", e)
         except Exception as e:
             self._logger.error("Error handling restart notice: %s", e, exc_info=True)
@@ -326,7 +330,7 @@ class LifecycleEventPublisher:
         payload.update(extra_data)
 
         try:
-            data_bytes = json.dumps(payload).encode("utf-8")
+            data_bytes = self._codec.dumps(payload)
             await self._nats.publish(subject, data_bytes)
             self._logger.info("Published startup event to %s", subject)
         except Exception as e:
@@ -345,7 +349,7 @@ class LifecycleEventPublisher:
         payload.update(extra_data)
 
         try:
-            data_bytes = json.dumps(payload).encode("utf-8")
+            data_bytes = self._codec.dumps(payload)
             await self._nats.publish(subject, data_bytes)
             self._logger.info("Published shutdown event to %s", subject)
         except Exception as e:
@@ -365,7 +369,7 @@ class LifecycleEventPublisher:
         payload.update(extra_data)
 
         try:
-            data_bytes = json.dumps(payload).encode("utf-8")
+            data_bytes = self._codec.dumps(payload)
             await self._nats.publish(subject, data_bytes)
             self._logger.debug("Published heartbeat to %s", subject)
         except Exception as e:
@@ -384,7 +388,7 @@ class LifecycleEventPublisher:
         payload.update(extra_data)
 
         try:
-            data_bytes = json.dumps(payload).encode("utf-8")
+            data_bytes = self._codec.dumps(payload)
             await self._nats.publish(subject, data_bytes)
             self._logger.debug("Published connected event to %s", subject)
         except Exception as e:
@@ -407,7 +411,7 @@ class LifecycleEventPublisher:
         payload.update(extra_data)
 
         try:
-            data_bytes = json.dumps(payload).encode("utf-8")
+            data_bytes = self._codec.dumps(payload)
             await self._nats.publish(subject, data_bytes)
             self._logger.warning("Published disconnected event to %s", subject)
         except Exception as e:
@@ -434,7 +438,7 @@ class LifecycleEventPublisher:
         payload.update(extra_data)
 
         try:
-            data_bytes = json.dumps(payload).encode("utf-8")
+            data_bytes = self._codec.dumps(payload)
             await self._nats.publish(subject, data_bytes)
             self._logger.warning(
                 "Published groupwide restart notice: %s (delay: %ss)", reason, delay_seconds
@@ -97,8 +97,10 @@ class MockKrytenClient:
         event_name: str,
         channel: str | None = None,
         domain: str | None = None,
+        broadcast: bool = False,
     ) -> Callable[[Callable[[Any], Any]], Callable[[Any], Any]]:
-        """Register event handler."""
+        """Register event handler (``broadcast`` has no effect in the mock)."""
+        _ = broadcast
 
         def decorator(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
             if event_name not in self._handlers:
@@ -489,15 +491,18 @@ class MockKrytenClient:
         self._events_received += 1
 
         # Find and invoke handlers
-        handlers = self._handlers.get(event_name.lower(), [])
+        # Handlers for the event first, then catch-all ("*") handlers
+        handlers = [*self._handlers.get(event_name.lower(), []), *self._handlers.get("*", [])]
+        typed_event = None
         for handler, channel_filter, domain_filter in handlers:
             if channel_filter and channel_filter != channel:
                 continue
             if domain_filter and domain_filter != domain:
                 continue
 
-            # Convert to typed event and invoke handler
-            typed_event = self._convert_to_typed_event(raw_event)
+            # Convert once, on first match, and share the instance across handlers
+            if typed_event is None:
+                typed_event = self._convert_to_typed_event(raw_event)
             await handler(typed_event)
 
     def _convert_to_typed_event(self, raw_event: RawEvent) -> Any:
@@ -1,4 +1,10 @@
-"""Event and data models for kryten-py library."""
+"""Event and data models for kryten-py library.
+
+Event models are frozen: one instance is shared by every handler of a message,
+so attribute assignment raises ``ValidationError``. Immutability is shallow;
+container fields such as ``RawEvent.payload`` are shared between handlers and
+must be treated as read-only (copy before modifying).
+"""
 
 import uuid
 from datetime import datetime, timezone
@@ -83,6 +89,8 @@ class ChatMessageEvent(BaseModel):
     domain: str = Field(..., description="Domain name")
     correlation_id: str = Field(..., description="Trace ID")
 
+    model_config = {"frozen": True}
+
 
 class UserJoinEvent(BaseModel):
     """User joined channel event.
@@ -103,6 +111,8 @@ class UserJoinEvent(BaseModel):
     domain: str
     correlation_id: str
 
+    model_config = {"frozen": True}
+
 
 class UserLeaveEvent(BaseModel):
     """User left channel event.
@@ -121,6 +131,8 @@ class UserLeaveEvent(BaseModel):
     domain: str
     correlation_id: str
 
+    model_config = {"frozen": True}
+
 
 class ChangeMediaEvent(BaseModel):
     """Media changed event.
@@ -147,6 +159,8 @@ class ChangeMediaEvent(BaseModel):
     domain: str
     correlation_id: str
 
+    model_config = {"frozen": True}
+
 
 class PlaylistUpdateEvent(BaseModel):
     """Playlist updated event.
@@ -167,6 +181,8 @@ class PlaylistUpdateEvent(BaseModel):
     domain: str
     correlation_id: str
 
+    model_config = {"frozen": True}
+
 
 __all__ = [
     "RawEvent",
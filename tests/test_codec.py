@@ -0,0 +1,123 @@
+"""Tests for pluggable JSON codecs."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from kryten.client import KrytenClient
+from kryten.codec import JsonCodec, get_codec
+from kryten.kv_store import kv_get, kv_put
+
+
+def available_codecs() -> list[str]:
+    """Names of the codec backends installed in this environment."""
+    names = []
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            get_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_codec_round_trip(name):
+    """Every backend encodes to bytes and decodes bytes or str."""
+    codec = get_codec(name)
+    value = {"command": "chat", "args": {"message": "héllo ✓"}, "n": [1, 2.5, None, True]}
+
+    encoded = codec.dumps(value)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == value
+    assert codec.loads(encoded) == value
+    assert codec.loads(encoded.decode("utf-8")) == value
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_codec_decode_error_is_value_error(name):
+    """Invalid JSON raises ValueError regardless of backend."""
+    with pytest.raises(ValueError):
+        get_codec(name).loads(b"not valid json")
+
+
+def test_auto_picks_an_installed_codec():
+    """auto prefers orjson, then msgspec, then stdlib json."""
+    installed = available_codecs()
+    expected = next(name for name in ("orjson", "msgspec", "json") if name in installed)
+    assert get_codec("auto").name == expected
+
+
+def test_unknown_codec_rejected():
+    """Unknown codec names raise ValueError."""
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+def test_client_uses_configured_codec():
+    """KrytenClient builds its codec from KrytenConfig.json_codec."""
+    client = KrytenClient(
+        {
+            "nats": {"servers": ["nats://localhost:4222"]},
+            "channels": [{"domain": "cytu.be", "channel": "lounge"}],
+            "json_codec": "json",
+        }
+    )
+    assert type(client._codec) is JsonCodec
+
+
+@pytest.mark.asyncio
+async def test_on_message_decodes_bytes_with_codec():
+    """_on_message hands the raw message bytes to the codec."""
+    client = KrytenClient(
+        {
+            "nats": {"servers": ["nats://localhost:4222"]},
+            "channels": [{"domain": "cytu.be", "channel": "lounge"}],
+        }
+    )
+    seen = []
+    loads = client._codec.loads
+
+    class RecordingCodec(JsonCodec):
+        def loads(self, data):
+            seen.append(type(data))
+            return loads(data)
+
+    client._codec = RecordingCodec()
+    received = []
+
+    @client.on("chatmsg")
+    async def handler(event):
+        received.append(event.message)
+
+    data = {
+        "event_name": "chatMsg",
+        "payload": {"username": "alice", "msg": "hi"},
+        "channel": "lounge",
+        "domain": "cytu.be",
+    }
+    await client._on_message(
+        SimpleNamespace(
+            subject="kryten.events.cytube.lounge.chatmsg", data=json.dumps(data).encode()
+        )
+    )
+
+    assert seen == [bytes]
+    assert received == ["hi"]
+    await client._dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_kv_helpers_use_codec():
+    """kv_get/kv_put encode and decode through the supplied codec."""
+    codec = get_codec("auto")
+    kv = AsyncMock()
+
+    assert await kv_put(kv, "key", {"a": 1}, as_json=True, codec=codec)
+    stored = kv.put.call_args[0][1]
+    assert stored == codec.dumps({"a": 1})
+
+    kv.get.return_value = SimpleNamespace(value=stored)
+    assert await kv_get(kv, "key", parse_json=True, codec=codec) == {"a": 1}
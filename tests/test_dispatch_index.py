@@ -0,0 +1,249 @@
+"""Tests for KrytenClient handler dispatch index."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from kryten.client import KrytenClient, _LazyTypedEvent
+from pydantic import ValidationError
+
+
+@pytest.fixture
+def client():
+    """Client with two configured channels."""
+    return KrytenClient(
+        {
+            "nats": {"servers": ["nats://localhost:4222"]},
+            "channels": [
+                {"domain": "cytu.be", "channel": "lounge"},
+                {"domain": "cytu.be", "channel": "movies"},
+            ],
+        }
+    )
+
+
+def make_msg(event_name: str, channel: str, domain: str = "cytu.be") -> SimpleNamespace:
+    """Build a fake NATS message carrying a RawEvent."""
+    data = {
+        "event_name": event_name,
+        "payload": {"username": "alice", "msg": "hi"},
+        "channel": channel,
+        "domain": domain,
+    }
+    return SimpleNamespace(
+        subject=f"kryten.events.cytube.{channel}.{event_name.lower()}",
+        data=json.dumps(data).encode("utf-8"),
+    )
+
+
+def test_index_rebuilt_on_registration(client):
+    """Registering a handler precompiles entries for configured channels."""
+
+    async def on_chat(event):
+        pass
+
+    client.on("chatMsg")(on_chat)
+
+    assert client._dispatch_index[("chatmsg", "lounge", "cytu.be")] == (on_chat,)
+    assert client._dispatch_index[("chatmsg", "movies", "cytu.be")] == (on_chat,)
+
+
+def test_resolve_applies_filters_in_registration_order(client):
+    """Channel and domain filters are applied when the index is built."""
+
+    async def global_handler(event):
+        pass
+
+    async def lounge_handler(event):
+        pass
+
+    async def other_domain_handler(event):
+        pass
+
+    client.on("chatmsg")(global_handler)
+    client.on("chatmsg", channel="lounge")(lounge_handler)
+    client.on("chatmsg", domain="example.com")(other_domain_handler)
+
+    assert client._resolve_handlers("chatmsg", "lounge", "cytu.be") == (
+        global_handler,
+        lounge_handler,
+    )
+    assert client._resolve_handlers("chatmsg", "movies", "cytu.be") == (global_handler,)
+    assert client._resolve_handlers("adduser", "lounge", "cytu.be") == ()
+
+
+def test_resolve_unconfigured_channel_is_not_cached(client):
+    """Channel/domain values from the wire never grow the index."""
+
+    async def on_chat(event):
+        pass
+
+    client.on("chatmsg")(on_chat)
+    size = len(client._dispatch_index)
+
+    for i in range(50):
+        assert client._resolve_handlers("chatmsg", f"elsewhere{i}", "cytu.be") == (on_chat,)
+        assert client._resolve_handlers("chatmsg", "lounge", f"domain{i}.example") == (on_chat,)
+
+    assert len(client._dispatch_index) == size
+
+
+def test_registration_only_reindexes_its_event(client):
+    """Registering a handler leaves other events' entries untouched."""
+
+    async def on_chat(event):
+        pass
+
+    async def on_join(event):
+        pass
+
+    client.on("chatmsg")(on_chat)
+    chat_entry = client._dispatch_index[("chatmsg", "lounge", "cytu.be")]
+
+    client.on("adduser")(on_join)
+
+    assert client._dispatch_index[("chatmsg", "lounge", "cytu.be")] is chat_entry
+    assert client._dispatch_index[("adduser", "lounge", "cytu.be")] == (on_join,)
+
+
+@pytest.mark.asyncio
+async def test_on_message_dispatches_via_index(client):
+    """_on_message invokes only the handlers whose filters match."""
+    received = []
+
+    @client.on("chatmsg")
+    async def on_any(event):
+        received.append(("any", event.channel))
+
+    @client.on("chatmsg", channel="movies")
+    async def on_movies(event):
+        received.append(("movies", event.channel))
+
+    await client._on_message(make_msg("chatMsg", "lounge"))
+    await client._on_message(make_msg("chatMsg", "movies"))
+
+    assert sorted(received) == [("any", "lounge"), ("any", "movies"), ("movies", "movies")]
+
+    # Handlers registered later are picked up
+    @client.on("chatmsg", channel="lounge")
+    async def on_lounge(event):
+        received.append(("lounge", event.channel))
+
+    received.clear()
+    await client._on_message(make_msg("chatMsg", "lounge"))
+    assert sorted(received) == [("any", "lounge"), ("lounge", "lounge")]
+
+
+@pytest.mark.asyncio
+async def test_typed_event_converted_once_and_shared(client):
+    """All handlers of a message receive the same immutable typed instance."""
+    received = []
+    conversions = []
+    convert = client._convert_to_typed_event
+
+    def counting_convert(raw_event):
+        conversions.append(raw_event)
+        return convert(raw_event)
+
+    client._convert_to_typed_event = counting_convert
+
+    for _ in range(3):
+
+        @client.on("chatmsg")
+        async def handler(event):
+            received.append(event)
+
+    await client._on_message(make_msg("chatMsg", "lounge"))
+
+    assert len(conversions) == 1
+    assert len(received) == 3
+    assert received[0] is received[1] is received[2]
+    with pytest.raises(ValidationError):
+        received[0].message = "changed"
+
+
+@pytest.mark.asyncio
+async def test_no_conversion_without_matching_handlers(client):
+    """Events with no matching handler are never converted."""
+    conversions = []
+    client._convert_to_typed_event = conversions.append
+
+    @client.on("chatmsg", channel="movies")
+    async def handler(event):
+        pass
+
+    await client._on_message(make_msg("chatMsg", "lounge"))
+    await client._on_message(make_msg("adduser", "lounge"))
+
+    assert conversions == []
+
+
+def test_lazy_typed_event_caches_none_result():
+    """A converter returning None still runs only once."""
+    calls = []
+
+    def convert(raw_event):
+        calls.append(raw_event)
+        return None
+
+    event = _LazyTypedEvent("raw", convert)
+
+    assert event.get() is None
+    assert event.get() is None
+    assert calls == ["raw"]
+
+
+@pytest.mark.asyncio
+async def test_on_message_skips_unhandled_subjects_without_decoding():
+    """Events whose subject names an unhandled event are counted and never decoded."""
+    client = KrytenClient(
+        {
+            "nats": {"servers": ["nats://localhost:4222"]},
+            "channels": [{"domain": "cytu.be", "channel": "lounge"}],
+        }
+    )
+
+    @client.on("chatMsg")
+    async def handler(event):
+        pass
+
+    decoded = []
+    loads = client._codec.loads
+    client._codec.loads = lambda data: decoded.append(data) or loads(data)  # type: ignore[method-assign]
+
+    await client._on_message(
+        SimpleNamespace(subject="kryten.events.cytube.lounge.mediaupdate", data=b"not json")
+    )
+
+    assert decoded == []
+    health = client.health()
+    assert health.events_skipped == 1
+    assert health.events_received == 0
+    assert health.errors == 0
+
+
+@pytest.mark.asyncio
+async def test_on_message_catch_all_disables_subject_skip():
+    """A catch-all handler receives events that have no specific handler."""
+    client = KrytenClient(
+        {
+            "nats": {"servers": ["nats://localhost:4222"]},
+            "channels": [{"domain": "cytu.be", "channel": "lounge"}],
+        }
+    )
+    received = []
+
+    @client.on("*")
+    async def handler(event):
+        received.append(event.event_name)
+
+    data = {"event_name": "mediaUpdate", "payload": {}, "channel": "lounge", "domain": "cytu.be"}
+    await client._on_message(
+        SimpleNamespace(
+            subject="kryten.events.cytube.lounge.mediaupdate", data=json.dumps(data).encode()
+        )
+    )
+
+    assert received == ["mediaUpdate"]
+    assert client.health().events_skipped == 0
+    await client._dispatcher.stop()
@@ -0,0 +1,368 @@
+"""Tests for the bounded handler worker pool."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from kryten.client import KrytenClient
+from kryten.dispatcher import HandlerDispatcher
+
+
+class Recorder:
+    """Invoke function that records events and can be held open."""
+
+    def __init__(self) -> None:
+        self.events: list = []
+        self.running = 0
+        self.max_running = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, handler, event) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self.release.wait()
+            self.events.append(event)
+        finally:
+            self.running -= 1
+
+
+async def noop(event):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_concurrency_bounded_by_max_workers():
+    """No more than max_workers jobs run at once."""
+    recorder = Recorder()
+    dispatcher = HandlerDispatcher(recorder, max_workers=3, max_queue=100)
+
+    futures = [await dispatcher.submit(noop, i, wait=True) for i in range(10)]
+    await asyncio.sleep(0)
+
+    assert dispatcher.workers == 3
+    assert recorder.running == 3
+    assert dispatcher.queue_depth == 7
+
+    recorder.release.set()
+    await asyncio.gather(*futures)
+
+    assert recorder.max_running == 3
+    assert sorted(recorder.events) == list(range(10))
+    assert dispatcher.processed == 10
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_drop_newest_discards_incoming_job():
+    """drop_newest keeps queued jobs and discards the new one."""
+    recorder = Recorder()
+    dispatcher = HandlerDispatcher(recorder, max_workers=1, max_queue=2, overflow="drop_newest")
+
+    await dispatcher.submit(noop, "running")
+    await asyncio.sleep(0)
+    await dispatcher.submit(noop, "a")
+    await dispatcher.submit(noop, "b")
+    dropped = await dispatcher.submit(noop, "c", wait=True)
+
+    assert dropped is not None and dropped.done()
+    assert dispatcher.dropped == 1
+
+    recorder.release.set()
+    while dispatcher.processed < 3:
+        await asyncio.sleep(0)
+    assert recorder.events == ["running", "a", "b"]
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_discards_queue_head():
+    """drop_oldest evicts the oldest queued job and resolves its future."""
+    recorder = Recorder()
+    dispatcher = HandlerDispatcher(recorder, max_workers=1, max_queue=2, overflow="drop_oldest")
+
+    await dispatcher.submit(noop, "running")
+    await asyncio.sleep(0)
+    oldest = await dispatcher.submit(noop, "a", wait=True)
+    await dispatcher.submit(noop, "b")
+    await dispatcher.submit(noop, "c")
+
+    assert oldest is not None and oldest.done()
+    assert dispatcher.dropped == 1
+
+    recorder.release.set()
+    while dispatcher.processed < 3:
+        await asyncio.sleep(0)
+    assert recorder.events == ["running", "b", "c"]
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_block_waits_for_space():
+    """block applies backpressure instead of dropping."""
+    recorder = Recorder()
+    dispatcher = HandlerDispatcher(recorder, max_workers=1, max_queue=1, overflow="block")
+
+    await dispatcher.submit(noop, "running")
+    await asyncio.sleep(0)
+    await dispatcher.submit(noop, "queued")
+
+    blocked = asyncio.create_task(dispatcher.submit(noop, "blocked"))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    recorder.release.set()
+    await asyncio.wait_for(blocked, timeout=1.0)
+    while dispatcher.processed < 3:
+        await asyncio.sleep(0)
+    assert dispatcher.dropped == 0
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_resolves_pending_futures():
+    """Stopping cancels workers and releases anyone waiting on queued jobs."""
+    recorder = Recorder()
+    dispatcher = HandlerDispatcher(recorder, max_workers=1, max_queue=10)
+
+    running = await dispatcher.submit(noop, "running", wait=True)
+    queued = await dispatcher.submit(noop, "queued", wait=True)
+    await asyncio.sleep(0)
+
+    await dispatcher.stop()
+
+    assert running is not None and running.done()
+    assert queued is not None and queued.done()
+    assert dispatcher.workers == 0
+    assert dispatcher.queue_depth == 0
+
+
+def test_invalid_overflow_policy():
+    """Unknown overflow policies are rejected."""
+    with pytest.raises(ValueError):
+        HandlerDispatcher(Recorder(), max_workers=1, max_queue=1, overflow="spill")
+
+
+@pytest.mark.asyncio
+async def test_client_health_reports_dispatcher_counters():
+    """health() exposes queue depth, active handlers and drop counters."""
+    client = KrytenClient(
+        {
+            "nats": {"servers": ["nats://localhost:4222"]},
+            "channels": [{"domain": "cytu.be", "channel": "lounge"}],
+            "max_concurrent_handlers": 1,
+            "handler_queue_size": 1,
+            "handler_overflow_policy": "drop_newest",
+        }
+    )
+    release = asyncio.Event()
+
+    async def slow(event):
+        await release.wait()
+
+    event = SimpleNamespace(get=lambda: None)
+    await client._dispatcher.submit(slow, event)
+    await asyncio.sleep(0)
+    await client._dispatcher.submit(slow, event)
+    await client._dispatcher.submit(slow, event)
+
+    health = client.health()
+    assert health.active_handlers == 1
+    assert health.handler_queue_depth == 1
+    assert health.dropped_handler_jobs == 1
+
+    release.set()
+    await client._dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_recancels_worker_that_swallows_cancellation():
+    """A worker that swallows one cancellation is cancelled again."""
+    swallowed = []
+
+    async def swallow_once(handler, event):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            swallowed.append(event)
+
+    dispatcher = HandlerDispatcher(swallow_once, max_workers=1, max_queue=10)
+    await dispatcher.submit(noop, "job")
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(dispatcher.stop(timeout=2.0), timeout=3.0)
+
+    assert swallowed == ["job"]
+    assert dispatcher.workers == 0
+
+
+@pytest.mark.asyncio
+async def test_stop_is_bounded_when_worker_refuses_to_exit():
+    """stop() gives up after its timeout instead of hanging."""
+    released = asyncio.Event()
+
+    async def stubborn(handler, event):
+        while not released.is_set():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                pass
+
+    dispatcher = HandlerDispatcher(stubborn, max_workers=1, max_queue=10)
+    await dispatcher.submit(noop, "job")
+    await asyncio.sleep(0)
+    worker = next(iter(dispatcher._workers))
+
+    await asyncio.wait_for(dispatcher.stop(timeout=0.2), timeout=2.0)
+
+    released.set()
+    worker.cancel()
+    await asyncio.gather(worker, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_jobs_are_not_counted_as_processed():
+    """Only jobs that ran to completion increment processed."""
+    recorder = Recorder()
+    dispatcher = HandlerDispatcher(recorder, max_workers=1, max_queue=10)
+
+    await dispatcher.submit(noop, "running")
+    await asyncio.sleep(0)
+    await dispatcher.stop()
+
+    assert dispatcher.processed == 0
+
+
+@pytest.mark.asyncio
+async def test_on_message_applies_overflow_policy():
+    """Handler jobs beyond the queue size are dropped when _on_message dispatches."""
+    client = KrytenClient(
+        {
+            "nats": {"servers": ["nats://localhost:4222"]},
+            "channels": [{"domain": "cytu.be", "channel": "lounge"}],
+            "max_concurrent_handlers": 1,
+            "handler_queue_size": 2,
+            "handler_overflow_policy": "drop_newest",
+        }
+    )
+    received = []
+
+    for i in range(5):
+
+        @client.on("chatmsg")
+        async def handler(event, i=i):
+            received.append(i)
+
+    data = {
+        "event_name": "chatMsg",
+        "payload": {"username": "alice", "msg": "hi"},
+        "channel": "lounge",
+        "domain": "cytu.be",
+    }
+    msg = SimpleNamespace(
+        subject="kryten.events.cytube.lounge.chatmsg", data=json.dumps(data).encode("utf-8")
+    )
+    await client._on_message(msg)
+
+    assert received == [0, 1]
+    assert client.health().dropped_handler_jobs == 3
+    await client._dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_keyed_jobs_run_sequentially_in_order():
+    """Jobs sharing a key never overlap and keep submission order."""
+    running: dict[str, int] = {}
+    overlap = []
+    order: list[tuple[str, int]] = []
+
+    async def invoke(handler, event):
+        key, i = event
+        running[key] = running.get(key, 0) + 1
+        if running[key] > 1:
+            overlap.append(event)
+        await asyncio.sleep(0.001 * (5 - i % 5))
+        order.append(event)
+        running[key] -= 1
+
+    dispatcher = HandlerDispatcher(invoke, max_workers=8, max_queue=100)
+    for i in range(10):
+        for key in ("a", "b"):
+            await dispatcher.submit(noop, (key, i), key=key)
+
+    while dispatcher.processed < 20:
+        await asyncio.sleep(0.001)
+
+    assert overlap == []
+    assert [i for k, i in order if k == "a"] == list(range(10))
+    assert [i for k, i in order if k == "b"] == list(range(10))
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_keyed_backlog_counts_towards_queue_limit():
+    """Jobs waiting behind their key are subject to the overflow policy."""
+    recorder = Recorder()
+    dispatcher = HandlerDispatcher(recorder, max_workers=4, max_queue=2, overflow="drop_oldest")
+
+    await dispatcher.submit(noop, "running", key="k")
+    await asyncio.sleep(0)
+    await dispatcher.submit(noop, "a", key="k")
+    await dispatcher.submit(noop, "b", key="k")
+    assert dispatcher.queue_depth == 2
+
+    await dispatcher.submit(noop, "c", key="k")
+    assert dispatcher.dropped == 1
+
+    recorder.release.set()
+    while dispatcher.processed < 3:
+        await asyncio.sleep(0)
+    assert recorder.events == ["running", "b", "c"]
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_pipelined_on_message_returns_before_handlers_finish():
+    """In pipelined mode a slow handler does not hold up the subscription callback."""
+    client = KrytenClient(
+        {
+            "nats": {"servers": ["nats://localhost:4222"]},
+            "channels": [{"domain": "cytu.be", "channel": "lounge"}],
+            "dispatch_mode": "pipelined",
+            "dispatch_ordering": "user",
+        }
+    )
+    release = asyncio.Event()
+    received = []
+
+    @client.on("chatmsg")
+    async def slow(event):
+        await release.wait()
+        received.append((event.username, event.message))
+
+    def message(username, text):
+        data = {
+            "event_name": "chatMsg",
+            "payload": {"username": username, "msg": text},
+            "channel": "lounge",
+            "domain": "cytu.be",
+        }
+        return SimpleNamespace(
+            subject="kryten.events.cytube.lounge.chatmsg", data=json.dumps(data).encode("utf-8")
+        )
+
+    for text in ("one", "two", "three"):
+        await asyncio.wait_for(client._on_message(message("alice", text)), timeout=1.0)
+    await asyncio.wait_for(client._on_message(message("bob", "hi")), timeout=1.0)
+
+    # alice's messages are ordered behind each other; bob's runs alongside
+    await asyncio.sleep(0)
+    assert client.health().active_handlers == 2
+    assert client.health().handler_queue_depth == 2
+
+    release.set()
+    while client._dispatcher.processed < 4:
+        await asyncio.sleep(0)
+    assert [m for u, m in received if u == "alice"] == ["one", "two", "three"]
+    await client._dispatcher.stop()
@@ -0,0 +1,115 @@
+"""Tests for the unvalidated fast event models."""
+
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from kryten.client import KrytenClient
+from kryten.fast_models import FastChatMessageEvent, FastRawEvent, FastUserJoinEvent
+from kryten.models import ChatMessageEvent, RawEvent
+
+
+def make_client(fast_models: bool) -> KrytenClient:
+    return KrytenClient(
+        {
+            "nats": {"servers": ["nats://localhost:4222"]},
+            "channels": [{"domain": "cytu.be", "channel": "lounge"}],
+            "fast_models": fast_models,
+        }
+    )
+
+
+def test_fast_raw_event_parses_wire_envelope():
+    """FastRawEvent parses the timestamp and ignores unknown keys."""
+    event = FastRawEvent.parse(
+        event_name="chatMsg",
+        payload={"msg": "hi"},
+        channel="lounge",
+        domain="cytu.be",
+        timestamp="2024-01-01T00:00:00Z",
+        correlation_id="abc",
+        unexpected="ignored",
+    )
+
+    assert event.timestamp == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert event.correlation_id == "abc"
+    assert json.loads(event.to_bytes())["timestamp"] == "2024-01-01T00:00:00+00:00"
+
+
+def test_fast_raw_event_defaults_match_raw_event():
+    """Missing timestamp and correlation_id get RawEvent-style defaults."""
+    event = FastRawEvent.parse(event_name="x", payload={}, channel="c", domain="d")
+
+    assert event.timestamp.tzinfo is timezone.utc
+    assert len(event.correlation_id) == 36
+
+
+def test_fast_models_are_immutable_and_comparable():
+    """Fast models reject assignment and compare by value."""
+    fields = {
+        "username": "bob",
+        "rank": 1,
+        "timestamp": datetime.now(timezone.utc),
+        "channel": "lounge",
+        "domain": "cytu.be",
+        "correlation_id": "abc",
+    }
+    event = FastUserJoinEvent(**fields)
+
+    with pytest.raises(AttributeError):
+        event.username = "eve"  # type: ignore[misc]
+    assert event == FastUserJoinEvent(**fields)
+    assert event.model_dump() == fields
+
+
+def test_fast_model_missing_field_raises():
+    """Required fields are still required."""
+    with pytest.raises(TypeError):
+        FastUserJoinEvent(username="bob")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("fast_models", "raw_cls", "chat_cls"),
+    [(False, RawEvent, ChatMessageEvent), (True, FastRawEvent, FastChatMessageEvent)],
+)
+async def test_on_message_builds_configured_models(fast_models, raw_cls, chat_cls):
+    """_on_message uses pydantic or fast models according to config, with the same fields."""
+    client = make_client(fast_models)
+    received = []
+
+    @client.on("chatmsg")
+    async def handler(event):
+        received.append(event)
+
+    raw_events = []
+    convert = client._convert_to_typed_event
+
+    def recording_convert(raw_event):
+        raw_events.append(raw_event)
+        return convert(raw_event)
+
+    client._convert_to_typed_event = recording_convert  # type: ignore[method-assign]
+
+    data = {
+        "event_name": "chatMsg",
+        "payload": {"user": {"name": "alice", "rank": 2}, "msg": "hi", "meta": {"shadow": True}},
+        "channel": "lounge",
+        "domain": "cytu.be",
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "correlation_id": "abc",
+    }
+    await client._on_message(
+        SimpleNamespace(
+            subject="kryten.events.cytube.lounge.chatmsg", data=json.dumps(data).encode()
+        )
+    )
+
+    assert type(raw_events[0]) is raw_cls
+    (event,) = received
+    assert type(event) is chat_cls
+    assert (event.username, event.message, event.rank, event.shadow) == ("alice", "hi", 2, True)
+    assert event.timestamp == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert event.correlation_id == "abc"
+    await client._dispatcher.stop()
@@ -0,0 +1,139 @@
+"""Tests for JetStream durable pull-consumer intake.
+
+The integration test needs a local nats-server with JetStream enabled
+(``nats-server -js``) on ``KRYTEN_TEST_NATS`` (default nats://localhost:4222)
+and is skipped otherwise.
+"""
+
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import nats
+import pytest
+from kryten.client import KrytenClient
+
+NATS_URL = os.environ.get("KRYTEN_TEST_NATS", "nats://localhost:4222")
+
+
+def make_config(**jetstream):
+    return {
+        "nats": {"servers": [NATS_URL]},
+        "channels": [{"domain": "cytu.be", "channel": "lounge"}],
+        "jetstream": {"stream": "KRYTEN_TEST_EVENTS", "durable": "kryten_test", **jetstream},
+    }
+
+
+def event_bytes(text: str) -> bytes:
+    data = {
+        "event_name": "chatMsg",
+        "payload": {"username": "alice", "msg": text},
+        "channel": "lounge",
+        "domain": "cytu.be",
+    }
+    return json.dumps(data).encode()
+
+
+@pytest.mark.asyncio
+async def test_fetch_loop_acks_after_handlers_finish():
+    """Each fetched message is acked only once its handlers have completed."""
+    client = KrytenClient(make_config(batch_size=2, fetch_timeout=0.01))
+    order = []
+
+    @client.on("chatmsg")
+    async def handler(event):
+        await asyncio.sleep(0.01)
+        order.append(("handled", event.message))
+
+    def make_msg(text):
+        msg = SimpleNamespace(subject="kryten.events.cytube.lounge.chatmsg", data=event_bytes(text))
+
+        async def ack():
+            order.append(("acked", text))
+
+        msg.ack = ack
+        return msg
+
+    batches = [[make_msg("one"), make_msg("two")], asyncio.TimeoutError()]
+    done = asyncio.Event()
+
+    async def fetch(batch, timeout):
+        if not batches:
+            done.set()
+            await asyncio.sleep(3600)
+        item = batches.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        assert batch == 2
+        return item
+
+    psub = MagicMock(fetch=AsyncMock(side_effect=fetch))
+    task = asyncio.create_task(client._jetstream_fetch_loop(psub, client.config.jetstream))
+    await asyncio.wait_for(done.wait(), timeout=2.0)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    for text in ("one", "two"):
+        assert order.index(("handled", text)) < order.index(("acked", text))
+    await client._dispatcher.stop()
+
+
+async def _jetstream_available() -> bool:
+    try:
+        nc = await nats.connect(NATS_URL, connect_timeout=1, max_reconnect_attempts=0)
+    except Exception:
+        return False
+    try:
+        await nc.jetstream().account_info()
+        return True
+    except Exception:
+        return False
+    finally:
+        await nc.close()
+
+
+@pytest.mark.asyncio
+async def test_jetstream_intake_against_local_server():
+    """Events published before connect are delivered through the durable consumer."""
+    if not await _jetstream_available():
+        pytest.skip(f"no JetStream-enabled nats-server at {NATS_URL}")
+
+    nc = await nats.connect(NATS_URL)
+    js = nc.jetstream()
+    try:
+        await js.delete_stream("KRYTEN_TEST_EVENTS")
+    except Exception:
+        pass
+    await js.add_stream(name="KRYTEN_TEST_EVENTS", subjects=["kryten.events.cytube.>"])
+    for i in range(5):
+        await js.publish("kryten.events.cytube.lounge.chatmsg", event_bytes(f"m{i}"))
+
+    client = KrytenClient(make_config(batch_size=2, fetch_timeout=0.2))
+    received = []
+
+    @client.on("chatmsg")
+    async def handler(event):
+        received.append(event.message)
+
+    try:
+        await client.connect()
+        for _ in range(50):
+            if len(received) == 5:
+                break
+            await asyncio.sleep(0.1)
+        assert sorted(received) == [f"m{i}" for i in range(5)]
+
+        info = await js.consumer_info("KRYTEN_TEST_EVENTS", "kryten_test_lounge")
+        for _ in range(20):
+            if info.num_ack_pending == 0:
+                break
+            await asyncio.sleep(0.1)
+            info = await js.consumer_info("KRYTEN_TEST_EVENTS", "kryten_test_lounge")
+        assert info.num_ack_pending == 0
+        assert info.num_pending == 0
+    finally:
+        await client.disconnect()
+        await js.delete_stream("KRYTEN_TEST_EVENTS")
+        await nc.close()
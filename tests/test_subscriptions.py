@@ -0,0 +1,196 @@
+"""Tests for handler-driven event subscriptions."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from kryten.client import KrytenClient
+
+
+def make_client(per_event: bool = True, load_balance: bool = False) -> KrytenClient:
+    client = KrytenClient(
+        {
+            "nats": {"servers": ["nats://localhost:4222"]},
+            "channels": [
+                {"domain": "cytu.be", "channel": "lounge"},
+                {"domain": "cytu.be", "channel": "Movie.Night"},
+            ],
+            "subscribe_per_event": per_event,
+            "service": {"name": "mybot", "load_balance": load_balance},
+        }
+    )
+    nats = MagicMock()
+    nats.subscribe = AsyncMock(
+        side_effect=lambda subject, queue="", cb=None: MagicMock(
+            subject=subject, queue=queue, cb=cb, unsubscribe=AsyncMock()
+        )
+    )
+    client._nats = nats
+    return client
+
+
+def subscribed(client: KrytenClient) -> set[str]:
+    return {subject for subject, _ in client._event_subscriptions}
+
+
+@pytest.mark.asyncio
+async def test_default_subscribes_channel_wildcards():
+    """Without subscribe_per_event each channel gets a '>' subscription."""
+    client = make_client(per_event=False)
+
+    @client.on("chatmsg")
+    async def handler(event):
+        pass
+
+    await client._setup_subscriptions()
+
+    assert subscribed(client) == {
+        "kryten.events.cytube.lounge.>",
+        "kryten.events.cytube.movienight.>",
+    }
+
+
+@pytest.mark.asyncio
+async def test_per_event_subscribes_handled_events_only():
+    """Only events with handlers are subscribed, honouring channel filters."""
+    client = make_client()
+
+    @client.on("chatMsg")
+    async def chat(event):
+        pass
+
+    @client.on("adduser", channel="lounge")
+    async def join(event):
+        pass
+
+    await client._setup_subscriptions()
+
+    assert subscribed(client) == {
+        "kryten.events.cytube.lounge.chatmsg",
+        "kryten.events.cytube.lounge.adduser",
+        "kryten.events.cytube.movienight.chatmsg",
+    }
+
+
+@pytest.mark.asyncio
+async def test_handlers_registered_after_connect_add_subscriptions():
+    """on() after connect subscribes to the new event's subjects."""
+    client = make_client()
+    await client._setup_subscriptions()
+    assert subscribed(client) == set()
+
+    client._connected = True
+
+    @client.on("pm")
+    async def pm(event):
+        pass
+
+    await asyncio.gather(*client._subscription_tasks)
+
+    assert subscribed(client) == {
+        "kryten.events.cytube.lounge.pm",
+        "kryten.events.cytube.movienight.pm",
+    }
+
+
+@pytest.mark.asyncio
+async def test_catch_all_falls_back_to_wildcard():
+    """A '*' handler replaces per-event subscriptions with the channel wildcard."""
+    client = make_client()
+
+    @client.on("chatmsg")
+    async def chat(event):
+        pass
+
+    await client._setup_subscriptions()
+    per_event = dict(client._event_subscriptions)
+
+    @client.on("*", channel="lounge")
+    async def everything(event):
+        pass
+
+    await client._sync_subscriptions()
+
+    assert subscribed(client) == {
+        "kryten.events.cytube.lounge.>",
+        "kryten.events.cytube.movienight.chatmsg",
+    }
+    per_event[("kryten.events.cytube.lounge.chatmsg", None)].unsubscribe.assert_awaited_once()
+
+
+def test_catch_all_handlers_are_dispatched_after_specific_handlers():
+    """'*' handlers match every event, after the event's own handlers."""
+    client = make_client()
+
+    async def specific(event):
+        pass
+
+    async def any_event(event):
+        pass
+
+    client.on("*")(any_event)
+    client.on("chatmsg")(specific)
+
+    assert client._resolve_handlers("chatmsg", "lounge", "cytu.be") == (specific, any_event)
+    assert client._resolve_handlers("usercount", "lounge", "cytu.be") == (any_event,)
+
+
+@pytest.mark.asyncio
+async def test_load_balance_uses_service_queue_group():
+    """Shared handlers get a queue-group subscription, broadcast handlers a plain one."""
+    client = make_client(per_event=False, load_balance=True)
+    shared, broadcast = [], []
+
+    @client.on("chatmsg")
+    async def on_chat(event):
+        shared.append(event.message)
+
+    @client.on("adduser", channel="lounge", broadcast=True)
+    async def on_join(event):
+        broadcast.append(event.username)
+
+    await client._setup_subscriptions()
+
+    subs = {key: sub.queue for key, sub in client._event_subscriptions.items()}
+    assert subs == {
+        ("kryten.events.cytube.lounge.>", False): "mybot",
+        ("kryten.events.cytube.movienight.>", False): "mybot",
+        ("kryten.events.cytube.lounge.>", True): "",
+    }
+
+    def message(event_name, payload):
+        data = {
+            "event_name": event_name,
+            "payload": payload,
+            "channel": "lounge",
+            "domain": "cytu.be",
+        }
+        return SimpleNamespace(
+            subject=f"kryten.events.cytube.lounge.{event_name.lower()}",
+            data=json.dumps(data).encode(),
+        )
+
+    queue_cb = client._event_subscriptions[("kryten.events.cytube.lounge.>", False)].cb
+    broadcast_cb = client._event_subscriptions[("kryten.events.cytube.lounge.>", True)].cb
+    for cb in (queue_cb, broadcast_cb):
+        await cb(message("chatMsg", {"username": "alice", "msg": "hi"}))
+        await cb(message("addUser", {"name": "bob", "rank": 1}))
+
+    assert shared == ["hi"]
+    assert broadcast == ["bob"]
+    await client._dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_passes_queue_group():
+    """subscribe() forwards the queue group to NATS."""
+    client = make_client()
+
+    async def handler(msg):
+        pass
+
+    sub = await client.subscribe("kryten.custom.topic", handler, queue="workers")
+
+    assert sub.queue == "workers"